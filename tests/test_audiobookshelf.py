@@ -0,0 +1,97 @@
+"""Tests for the Audiobookshelf client."""
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from textcast.audiobookshelf import AudiobookshelfClient
+
+
+def _response(status_code=200, content=b"", json_data=None, text=""):
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.text = text
+    response.json.return_value = json_data
+    return response
+
+
+class TestMakeRequest:
+    """Tests for API requests sent through the client's requests session."""
+
+    def test_client_opens_its_own_session(self):
+        """Test that a client created without a session still has one."""
+        client = AudiobookshelfClient("key", "http://localhost:13378")
+
+        assert isinstance(client.session, requests.Session)
+
+    def test_upload_sends_multipart_through_session(self, tmp_path):
+        """Test that files go out as field '0' with the form data."""
+        audio_path = tmp_path / "episode.mp3"
+        audio_path.write_bytes(b"fake audio data")
+        session = MagicMock()
+        session.request.return_value = _response(
+            content=b'{"ok": true}', json_data={"ok": True}
+        )
+        client = AudiobookshelfClient("key", "http://localhost:13378/", session=session)
+
+        result = client.make_request(
+            "POST",
+            "/api/upload",
+            data={"title": "Episode"},
+            files={str(audio_path): audio_path.name},
+        )
+
+        assert result == {"ok": True}
+        args, kwargs = session.request.call_args
+        assert args == ("POST", "http://localhost:13378/api/upload")
+        assert kwargs["headers"] == {"Authorization": "Bearer key"}
+        assert kwargs["data"] == {"title": "Episode"}
+        file_name, file_obj, content_type = kwargs["files"]["0"]
+        assert file_name == "episode.mp3"
+        assert content_type == "application/octet-stream"
+        assert file_obj.closed
+
+    def test_get_returns_json(self):
+        """Test that a plain GET returns the decoded JSON body."""
+        session = MagicMock()
+        session.request.return_value = _response(
+            content=b'{"libraries": []}', json_data={"libraries": []}
+        )
+        client = AudiobookshelfClient("key", "http://localhost:13378", session=session)
+
+        assert client.make_request("GET", "/api/libraries") == {"libraries": []}
+        session.request.assert_called_once_with(
+            "GET",
+            "http://localhost:13378/api/libraries",
+            headers={"Authorization": "Bearer key"},
+        )
+
+    def test_empty_body_returns_none(self):
+        """Test that an empty response body returns None."""
+        session = MagicMock()
+        session.request.return_value = _response()
+        client = AudiobookshelfClient("key", "http://localhost:13378", session=session)
+
+        assert client.make_request("GET", "/api/libraries") is None
+
+    def test_http_error_raises(self):
+        """Test that an error status raises with the server's message."""
+        session = MagicMock()
+        session.request.return_value = _response(
+            status_code=500, content=b"boom", text="boom"
+        )
+        client = AudiobookshelfClient("key", "http://localhost:13378", session=session)
+
+        with pytest.raises(Exception, match="500 - boom"):
+            client.make_request("GET", "/api/libraries")
+
+    def test_connection_error_raises(self):
+        """Test that a connection failure is reported as an Exception."""
+        session = MagicMock()
+        session.request.side_effect = requests.ConnectionError("refused")
+        client = AudiobookshelfClient("key", "http://localhost:13378", session=session)
+
+        with pytest.raises(Exception, match="connection failed"):
+            client.make_request("GET", "/api/libraries")
@@ -0,0 +1,128 @@
+"""Tests for shared text-to-audio and upload helpers."""
+
+import os
+import stat
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from textcast.common import process_text_to_audio, remove_lines_from_file
+from textcast.service_config import AudiobookshelfDestination, PodserviceDestination
+
+
+def _fake_tts(text, filename, model, voice):
+    filename.write_bytes(b"fake audio data")
+
+
+class TestProcessTextToAudio:
+    """Tests for uploading generated audio from process_text_to_audio."""
+
+    def _run(self, tmp_path, **kwargs):
+        with patch(
+            "textcast.openai.process_text_to_audio_openai", side_effect=_fake_tts
+        ), patch(
+            "textcast.common.upload_to_podservice", return_value=True
+        ) as mock_pod, patch(
+            "textcast.common.upload_to_audiobookshelf", return_value=True
+        ) as mock_abs:
+            process_text_to_audio(
+                "Some text",
+                "Test Episode",
+                "openai",
+                str(tmp_path),
+                "mp3",
+                "tts-1",
+                "alloy",
+                None,
+                **kwargs,
+            )
+        return mock_pod, mock_abs
+
+    def test_destinations_upload_and_cleanup(self, tmp_path):
+        """Test that every destination gets the file and it is removed after."""
+        destinations = [
+            PodserviceDestination(type="podservice", url="http://localhost:8083"),
+            AudiobookshelfDestination(
+                type="audiobookshelf",
+                url="http://localhost:13378",
+                library_name="Podcasts",
+            ),
+        ]
+
+        mock_pod, mock_abs = self._run(tmp_path, destinations=destinations)
+
+        assert mock_pod.call_args[1]["podservice_url"] == "http://localhost:8083"
+        assert mock_pod.call_args[1]["session"] is None
+        assert mock_abs.call_args[0][1:3] == ("http://localhost:13378", "Podcasts")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_session_is_passed_to_uploads(self, tmp_path):
+        """Test that a given session reaches both destination clients."""
+        session = MagicMock()
+        destinations = [
+            PodserviceDestination(type="podservice", url="http://localhost:8083"),
+            AudiobookshelfDestination(
+                type="audiobookshelf", url="http://localhost:13378"
+            ),
+        ]
+
+        mock_pod, mock_abs = self._run(
+            tmp_path, destinations=destinations, session=session
+        )
+
+        assert mock_pod.call_args[1]["session"] is session
+        assert mock_abs.call_args[1]["session"] is session
+
+    def test_legacy_parameters_pass_session(self, tmp_path):
+        """Test that the legacy upload parameters also use the session."""
+        session = MagicMock()
+
+        mock_pod, mock_abs = self._run(
+            tmp_path,
+            abs_url="http://localhost:13378",
+            abs_library="Podcasts",
+            podservice_url="http://localhost:8083",
+            session=session,
+        )
+
+        assert mock_pod.call_args[1]["session"] is session
+        assert mock_abs.call_args[1]["session"] is session
+
+
+class TestRemoveLinesFromFile:
+    """Tests for rewriting queue files without processed lines."""
+
+    def test_removes_matching_lines(self, tmp_path):
+        """Test that only lines whose stripped text matches are dropped."""
+        queue_file = tmp_path / "Texts.txt"
+        queue_file.write_text("https://a\n  https://b  \nhttps://c\n")
+
+        remove_lines_from_file(str(queue_file), {"https://a", "https://b"})
+
+        assert queue_file.read_text() == "https://c\n"
+
+    def test_keeps_mode(self, tmp_path):
+        """Test that the rewritten file keeps the original permissions."""
+        queue_file = tmp_path / "Texts.txt"
+        queue_file.write_text("https://a\nhttps://b\n")
+        os.chmod(queue_file, 0o640)
+
+        remove_lines_from_file(str(queue_file), {"https://a"})
+
+        assert stat.S_IMODE(queue_file.stat().st_mode) == 0o640
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlinks")
+    def test_rewrites_symlink_target(self, tmp_path):
+        """Test that a symlinked queue file stays a symlink to the updated file."""
+        target_dir = tmp_path / "synced"
+        target_dir.mkdir()
+        target = target_dir / "Texts.txt"
+        target.write_text("https://a\nhttps://b\n")
+        link = tmp_path / "Texts.txt"
+        link.symlink_to(target)
+
+        remove_lines_from_file(str(link), {"https://a"})
+
+        assert link.is_symlink()
+        assert target.read_text() == "https://b\n"
+        assert list(tmp_path.glob(".*.tmp")) == []
@@ -225,3 +225,30 @@ class TestUploadToPodservice:
                 assert "pub_date" in data
         finally:
             audio_path.unlink()
+
+    def test_upload_uses_given_session(self):
+        """Test that a passed session is used instead of module-level requests."""
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
+            f.write(b"fake audio data")
+            audio_path = Path(f.name)
+
+        try:
+            mock_response = MagicMock()
+            mock_response.status_code = 201
+            mock_response.json.return_value = {"success": True, "episode": {}}
+            session = MagicMock()
+            session.post.return_value = mock_response
+
+            with patch("textcast.podservice.requests.post") as mock_post:
+                result = upload_to_podservice(
+                    file_path=audio_path,
+                    title="Test Episode",
+                    podservice_url="http://localhost:8083",
+                    session=session,
+                )
+
+            assert result is True
+            mock_post.assert_not_called()
+            assert session.post.call_args[0][0] == "http://localhost:8083/api/episodes"
+        finally:
+            audio_path.unlink()
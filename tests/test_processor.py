@@ -0,0 +1,73 @@
+"""Tests for batch processing and source file updates."""
+
+from unittest.mock import patch
+
+from textcast.processor import ProcessingResult, process_texts
+
+AGGREGATOR_URL = "https://news.example.com/item?id=1"
+AGGREGATOR_ARTICLES = ["https://agg.example.com/1", "https://agg.example.com/2"]
+
+
+def _expand(url):
+    if url == AGGREGATOR_URL:
+        return True, list(AGGREGATOR_ARTICLES)
+    return False, []
+
+
+def _process(url, aggregator_sources, **kwargs):
+    if url.endswith("/fail") or url == AGGREGATOR_ARTICLES[1]:
+        return ProcessingResult(url=url, success=False, error="boom")
+    if url.endswith("/skip"):
+        return ProcessingResult(url=url, success=False, skipped=True, error="Filtered")
+    return ProcessingResult(url=url, success=True)
+
+
+class TestProcessTextsUrlFiles:
+    """Tests for process_texts with URLs drawn from several queue files."""
+
+    def test_each_file_gets_only_its_own_results(self, tmp_path):
+        """Test that queue and Failed.txt updates stay with the URL's file."""
+        dir_a = tmp_path / "a"
+        dir_b = tmp_path / "b"
+        dir_a.mkdir()
+        dir_b.mkdir()
+        file_a = dir_a / "Texts.txt"
+        file_b = dir_b / "Texts.txt"
+        file_a.write_text(
+            f"https://a.example.com/ok\nhttps://a.example.com/fail\n{AGGREGATOR_URL}\n"
+        )
+        file_b.write_text(
+            "https://b.example.com/ok\n"
+            "https://b.example.com/skip\n"
+            "https://b.example.com/fail\n"
+            "https://b.example.com/new\n"
+        )
+        url_files = {
+            "https://a.example.com/ok": [str(file_a)],
+            "https://a.example.com/fail": [str(file_a)],
+            AGGREGATOR_URL: [str(file_a)],
+            "https://b.example.com/ok": [str(file_b)],
+            "https://b.example.com/skip": [str(file_b)],
+            "https://b.example.com/fail": [str(file_b)],
+        }
+
+        with patch(
+            "textcast.processor.detect_and_expand_aggregator", side_effect=_expand
+        ), patch("textcast.processor._process_single_url", side_effect=_process):
+            results = process_texts(list(url_files), url_files=url_files, workers=1)
+
+        assert {r.url for r in results} == (
+            set(url_files) - {AGGREGATOR_URL} | set(AGGREGATOR_ARTICLES)
+        )
+        # Every processed line is gone; the aggregator too, as all its
+        # articles were processed
+        assert file_a.read_text() == ""
+        assert file_b.read_text() == "https://b.example.com/new\n"
+        # Failures land next to the file they came from, aggregator
+        # articles with their aggregator's file
+        assert (dir_a / "Failed.txt").read_text() == (
+            f"https://a.example.com/fail\n{AGGREGATOR_ARTICLES[1]}\n"
+        )
+        assert (dir_b / "Failed.txt").read_text() == (
+            "https://b.example.com/skip # Filtered\nhttps://b.example.com/fail\n"
+        )
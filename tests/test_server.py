@@ -1,6 +1,8 @@
 """Tests for the Textcast server API endpoints."""
 
+import gzip
 import json
+import queue
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
@@ -12,8 +14,8 @@ from textcast.service_config import ServiceConfig, load_config
 
 
 @pytest.fixture
-def server_app(tmp_path):
-    """Create a test Flask app with a minimal config."""
+def server(tmp_path):
+    """Create a test server with a minimal config."""
     texts_file = tmp_path / "Texts.txt"
     texts_file.touch()
 
@@ -41,31 +43,40 @@ server:
     config = load_config(str(config_path))
     server = TextcastServer(config)
     server.app.testing = True
+    return server, texts_file
+
+
+@pytest.fixture
+def server_app(server):
+    """Create a test Flask app with a minimal config."""
+    server, texts_file = server
     return server.app, texts_file
 
 
 class TestApiUrls:
     """Tests for POST /api/urls."""
 
-    def test_add_single_url(self, server_app):
-        app, texts_file = server_app
-        with app.test_client() as client:
+    def test_add_single_url(self, server):
+        server, texts_file = server
+        with server.app.test_client() as client:
             resp = client.post("/api/urls", json={"url": "https://example.com/article"})
             assert resp.status_code == 202
             data = resp.get_json()
             assert data["success"] is True
             assert data["count"] == 1
+            server._url_queue.join()
             assert "https://example.com/article" in texts_file.read_text()
 
-    def test_add_multiple_urls(self, server_app):
-        app, texts_file = server_app
-        with app.test_client() as client:
+    def test_add_multiple_urls(self, server):
+        server, texts_file = server
+        with server.app.test_client() as client:
             resp = client.post("/api/urls", json={
                 "urls": ["https://example.com/a", "https://example.com/b"]
             })
             assert resp.status_code == 202
             data = resp.get_json()
             assert data["count"] == 2
+            server._url_queue.join()
             content = texts_file.read_text()
             assert "https://example.com/a" in content
             assert "https://example.com/b" in content
@@ -120,6 +131,60 @@ class TestApiUrls:
             resp = client.post("/api/urls", json={"foo": "bar"})
             assert resp.status_code == 400
 
+    def test_queue_full(self, server):
+        server, texts_file = server
+        with patch.object(TextcastServer, "_enqueue_urls", side_effect=queue.Full):
+            with server.app.test_client() as client:
+                resp = client.post("/api/urls", json={"url": "https://example.com/a"})
+                assert resp.status_code == 503
+                assert resp.get_json()["success"] is False
+        assert texts_file.read_text() == ""
+
+
+class TestAddUrl:
+    """Tests for POST /add-url."""
+
+    def test_add_url_is_queued_and_written(self, server):
+        server, texts_file = server
+        with server.app.test_client() as client:
+            resp = client.post("/add-url", data={"url": "https://example.com/queued"})
+            assert resp.status_code == 302
+            assert "success=1" in resp.headers["Location"]
+        server._url_queue.join()
+        assert texts_file.read_text() == "https://example.com/queued\n"
+
+    def test_stop_writes_queued_urls(self, server):
+        server, texts_file = server
+        urls = [f"https://example.com/{i}" for i in range(50)]
+        for url in urls:
+            server._enqueue_urls(str(texts_file), [url])
+        writer = server._url_writer_thread
+
+        server.stop()
+
+        assert not writer.is_alive()
+        assert texts_file.read_text().splitlines() == urls
+
+    def test_url_added_after_stop_is_written(self, server):
+        server, texts_file = server
+        server._enqueue_urls(str(texts_file), ["https://example.com/before"])
+        server.stop()
+
+        server._enqueue_urls(str(texts_file), ["https://example.com/after"])
+
+        assert server._url_writer_thread is None
+        assert texts_file.read_text().splitlines() == [
+            "https://example.com/before",
+            "https://example.com/after",
+        ]
+
+    def test_add_url_queue_full(self, server):
+        server, texts_file = server
+        with patch.object(TextcastServer, "_enqueue_urls", side_effect=queue.Full):
+            with server.app.test_client() as client:
+                resp = client.post("/add-url", data={"url": "https://example.com/a"})
+                assert resp.status_code == 503
+
 
 class TestApiText:
     """Tests for POST /api/text."""
@@ -178,3 +243,35 @@ class TestApiText:
         with app.test_client() as client:
             resp = client.post("/api/text", content_type="application/json")
             assert resp.status_code == 400
+
+
+class TestCompression:
+    """Tests for gzip response compression."""
+
+    def test_index_gzipped_when_accepted(self, server_app):
+        app, _ = server_app
+        with app.test_client() as client:
+            resp = client.get("/", headers={"Accept-Encoding": "gzip"})
+            assert resp.status_code == 200
+            assert resp.headers["Content-Encoding"] == "gzip"
+            assert b"Textcast" in gzip.decompress(resp.data)
+
+    def test_index_plain_without_accept_encoding(self, server_app):
+        app, _ = server_app
+        with app.test_client() as client:
+            resp = client.get("/")
+            assert resp.status_code == 200
+            assert "Content-Encoding" not in resp.headers
+            assert b"Textcast" in resp.data
+
+
+class TestIndex:
+    """Tests for GET /."""
+
+    def test_error_is_escaped(self, server_app):
+        app, _ = server_app
+        with app.test_client() as client:
+            resp = client.get("/", query_string={"error": "<script>x</script>"})
+            assert resp.status_code == 200
+            assert b"<script>x</script>" not in resp.data
+            assert b"&lt;script&gt;x&lt;/script&gt;" in resp.data
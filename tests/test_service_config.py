@@ -1,5 +1,6 @@
 """Tests for service configuration, including destinations parsing."""
 
+import os
 import tempfile
 from pathlib import Path
 
@@ -10,7 +11,9 @@ from textcast.service_config import (
     AudiobookshelfDestination,
     PodserviceDestination,
     ServiceConfig,
+    SourceConfig,
     load_config,
+    parse_interval,
     save_config,
 )
 
@@ -312,3 +315,168 @@ class TestDestinationsSerialization:
         assert abs_dest.library_id == "lib-123"
         assert abs_dest.folder_id == "folder-456"
         assert abs_dest.enabled is False
+
+
+class TestSourcesSerialization:
+    """Test serialization of sources to config files."""
+
+    def test_poll_interval_saved_only_when_set(self, temp_config_dir):
+        """Test that an unset poll_interval is left out of the saved file."""
+        config_path = Path(temp_config_dir) / "config.yaml"
+        config = ServiceConfig(
+            sources=[
+                SourceConfig(type="file", name="local", file="/tmp/a.txt"),
+                SourceConfig(
+                    type="upload", name="nas", watch_dir="/mnt/nas", poll_interval=10
+                ),
+            ],
+        )
+
+        save_config(config, str(config_path))
+
+        with open(config_path, "r") as f:
+            saved_sources = yaml.safe_load(f)["sources"]
+        assert "poll_interval" not in saved_sources[0]
+        assert saved_sources[1]["poll_interval"] == 10
+        loaded = load_config(str(config_path))
+        assert [s.poll_interval for s in loaded.sources] == [None, 10]
+
+
+class TestParseInterval:
+    """Test parsing of interval strings."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("30s", 1),
+            ("120s", 2),
+            ("5m", 5),
+            (" 5M ", 5),
+            ("1h", 60),
+            ("2d", 2880),
+            (10, 10),
+        ],
+    )
+    def test_valid_intervals(self, value, expected):
+        """Test that intervals with units are converted to minutes."""
+        assert parse_interval(value) == expected
+
+    def test_bare_number_string_rejected(self):
+        """Test that bare number strings are rejected with a hint."""
+        with pytest.raises(ValueError, match="Bare numbers not allowed"):
+            parse_interval("5")
+
+    @pytest.mark.parametrize("value", ["", "m", "5x", "5 m", "1.5h", "abc"])
+    def test_invalid_intervals(self, value):
+        """Test that malformed intervals are rejected."""
+        with pytest.raises(ValueError, match="Invalid interval format"):
+            parse_interval(value)
+
+
+class TestIntervalStr:
+    """Test display formatting of the check interval."""
+
+    @pytest.mark.parametrize(
+        "minutes,expected",
+        [
+            (0, "0m"),
+            (5, "5m"),
+            (60, "1h"),
+            (90, "1h30m"),
+            (1440, "1d"),
+            (1500, "1d1h"),
+            (2885, "2d5m"),
+        ],
+    )
+    def test_interval_str(self, minutes, expected):
+        """Test that minutes are formatted with d/h/m units."""
+        assert ServiceConfig(check_interval=minutes).interval_str == expected
+
+
+class TestLoadConfig:
+    """Test loading of config files."""
+
+    @pytest.mark.parametrize("content", ["", "# only a comment\n", "- a\n- b\n"])
+    def test_non_mapping_config_rejected(self, temp_config_dir, content):
+        """Test that files whose root is not a mapping fail to load."""
+        config_path = Path(temp_config_dir) / "config.yaml"
+        config_path.write_text(content)
+
+        with pytest.raises(Exception, match="must be a mapping"):
+            load_config(str(config_path))
+
+    def test_missing_file_uses_defaults(self, temp_config_dir):
+        """Test that a config path that doesn't exist loads the defaults."""
+        config = load_config(str(Path(temp_config_dir) / "missing.yaml"))
+
+        assert config.check_interval == 5
+        assert config.sources == []
+
+    def test_directory_rejected(self, temp_config_dir):
+        """Test that a config path naming a directory fails to load."""
+        with pytest.raises(Exception, match="not a regular file"):
+            load_config(temp_config_dir)
+
+    def test_empty_mapping_uses_defaults(self, temp_config_dir):
+        """Test that an empty mapping loads the default configuration."""
+        config_path = Path(temp_config_dir) / "config.yaml"
+        config_path.write_text("{}\n")
+
+        config = load_config(str(config_path))
+
+        assert config.check_interval == 5
+        assert config.sources == []
+
+    def test_reload_returns_independent_copies(self, temp_config_dir):
+        """Test that cached loads don't share mutable state between callers."""
+        config_path = Path(temp_config_dir) / "config.yaml"
+        config_path.write_text("check_interval: 5m\nserver:\n  port: 9000\n")
+
+        first = load_config(str(config_path))
+        first.server.base_url = "http://example.com"
+        second = load_config(str(config_path))
+
+        assert second.server.port == 9000
+        assert second.server.base_url is None
+
+    def test_reload_picks_up_changes(self, temp_config_dir):
+        """Test that editing the file invalidates the cached parse."""
+        config_path = Path(temp_config_dir) / "config.yaml"
+        config_path.write_text("check_interval: 5m\n")
+        assert load_config(str(config_path)).check_interval == 5
+
+        config_path.write_text("check_interval: 10m\n")
+        assert load_config(str(config_path)).check_interval == 10
+
+    def test_reload_picks_up_same_size_edit_with_same_mtime(self, temp_config_dir):
+        """Test that an edit keeping mtime and size is not served stale."""
+        config_path = Path(temp_config_dir) / "config.yaml"
+        config_path.write_text("check_interval: 5m\n")
+        st = config_path.stat()
+        assert load_config(str(config_path)).check_interval == 5
+
+        config_path.write_text("check_interval: 6m\n")
+        os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert load_config(str(config_path)).check_interval == 6
+
+    def test_unknown_source_field_reports_config_path(self, temp_config_dir):
+        """Test that invalid fields raise a load error chained to the cause."""
+        config_path = Path(temp_config_dir) / "config.yaml"
+        config_path.write_text("sources:\n  - type: file\n    name: a\n    bogus: 1\n")
+
+        with pytest.raises(Exception, match="Failed to load configuration") as exc_info:
+            load_config(str(config_path))
+
+        assert isinstance(exc_info.value.__cause__, TypeError)
+
+    def test_duplicate_source_names_rejected(self, temp_config_dir):
+        """Test that two sources with the same name fail to load."""
+        config_path = Path(temp_config_dir) / "config.yaml"
+        config_path.write_text(
+            "sources:\n"
+            "  - type: file\n    name: a\n    file: /tmp/a.txt\n"
+            "  - type: file\n    name: a\n    file: /tmp/b.txt\n"
+        )
+
+        with pytest.raises(Exception, match="duplicate source name: 'a'"):
+            load_config(str(config_path))
@@ -0,0 +1,212 @@
+"""Tests for the service daemon's upload watchers."""
+
+import logging
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+import textcast.service_daemon as service_daemon
+from textcast.service_config import (
+    PodserviceDestination,
+    ServiceConfig,
+    SourceConfig,
+)
+
+
+def _wait_for(condition, timeout=15.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.1)
+    return False
+
+
+@pytest.fixture
+def running_service(request, tmp_path, monkeypatch):
+    """Run a service with one upload source; yields (watch_dir, uploaded).
+
+    Parametrize indirectly with a poll interval to use a polling observer.
+    """
+    uploaded = []
+
+    def fake_upload(file_path, title, destinations=None, **kwargs):
+        uploaded.append(file_path.name)
+        return True
+
+    monkeypatch.setattr(service_daemon, "upload_to_destinations", fake_upload)
+    monkeypatch.setattr(service_daemon, "UPLOAD_DEBOUNCE", 0.2)
+
+    watch_dir = tmp_path / "uploads"
+    watch_dir.mkdir()
+    config = ServiceConfig(
+        sources=[
+            SourceConfig(
+                type="upload",
+                name="uploads",
+                watch_dir=str(watch_dir),
+                file_patterns=["*.mp3"],
+                poll_interval=getattr(request, "param", None),
+            )
+        ],
+        destinations=[PodserviceDestination(type="podservice", url="http://x")],
+    )
+    config.processing.audio.output_dir = str(tmp_path / "audio")
+
+    handlers = {s: signal.getsignal(s) for s in (signal.SIGINT, signal.SIGTERM)}
+    service = service_daemon.TextcastService(config)
+    thread = threading.Thread(target=service.start, daemon=True)
+    thread.start()
+    # Give the observer time to start watching
+    time.sleep(1)
+    try:
+        yield watch_dir, uploaded
+    finally:
+        service.stop()
+        thread.join(timeout=30)
+        for signum, handler in handlers.items():
+            signal.signal(signum, handler)
+
+
+class TestUploadWatcher:
+    """Tests for files arriving in a watched upload directory."""
+
+    def test_file_written_in_place_is_uploaded(self, running_service):
+        """Test that a file written directly into the directory is uploaded once."""
+        watch_dir, uploaded = running_service
+
+        (watch_dir / "written.mp3").write_bytes(b"fake audio data")
+
+        assert _wait_for(lambda: uploaded == ["written.mp3"]), uploaded
+        # Later events for the same file must not upload it again
+        time.sleep(1)
+        assert uploaded == ["written.mp3"]
+        assert not (watch_dir / "written.mp3").exists()
+
+    def test_file_moved_in_from_outside_is_uploaded(self, running_service, tmp_path):
+        """Test that a file renamed in from outside the tree is uploaded once."""
+        watch_dir, uploaded = running_service
+        staging = tmp_path / "staging"
+        staging.mkdir()
+        (staging / "moved.mp3").write_bytes(b"fake audio data")
+
+        os.rename(staging / "moved.mp3", watch_dir / "moved.mp3")
+
+        assert _wait_for(lambda: uploaded == ["moved.mp3"]), uploaded
+        # Later events for the same file must not upload it again
+        time.sleep(1)
+        assert uploaded == ["moved.mp3"]
+        assert not (watch_dir / "moved.mp3").exists()
+
+    @pytest.mark.parametrize("running_service", [None, 0.2], indirect=True)
+    def test_file_renamed_within_directory_is_uploaded(self, running_service):
+        """Test that a temp file renamed into place is uploaded once."""
+        watch_dir, uploaded = running_service
+        (watch_dir / "renamed.mp3.part").write_bytes(b"fake audio data")
+        # Let the watcher see the temp file before it is renamed
+        time.sleep(0.5)
+
+        os.rename(watch_dir / "renamed.mp3.part", watch_dir / "renamed.mp3")
+
+        assert _wait_for(lambda: uploaded == ["renamed.mp3"]), uploaded
+        time.sleep(1)
+        assert uploaded == ["renamed.mp3"]
+        assert not (watch_dir / "renamed.mp3").exists()
+
+    def test_file_written_during_upload_is_uploaded_again(
+        self, running_service, monkeypatch
+    ):
+        """Test that a write made while a file uploads sends the new version."""
+        watch_dir, _ = running_service
+        contents = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_upload(file_path, title, destinations=None, **kwargs):
+            contents.append(file_path.read_bytes())
+            started.set()
+            release.wait(timeout=15)
+            return True
+
+        monkeypatch.setattr(service_daemon, "upload_to_destinations", slow_upload)
+        episode = watch_dir / "episode.mp3"
+
+        episode.write_bytes(b"first version")
+        assert started.wait(timeout=15)
+        episode.write_bytes(b"second version")
+        # Let the watcher see the second write before the first upload ends
+        time.sleep(1)
+        release.set()
+
+        assert _wait_for(lambda: contents == [b"first version", b"second version"]), (
+            contents
+        )
+        assert _wait_for(lambda: not episode.exists())
+
+
+class TestFileQueues:
+    """Tests for processing several file queues in one batch."""
+
+    def test_url_shared_between_queue_files_is_removed_from_both(
+        self, tmp_path, monkeypatch
+    ):
+        """Test that a URL listed in two queue files is cleared from each."""
+        from textcast import processor
+
+        monkeypatch.setattr(
+            processor, "detect_and_expand_aggregator", lambda url: (False, [])
+        )
+        monkeypatch.setattr(
+            processor,
+            "_process_single_url",
+            lambda url, aggregator_sources, **kwargs: processor.ProcessingResult(
+                url=url, success=True
+            ),
+        )
+        shared = "https://example.com/shared"
+        file_a = tmp_path / "a" / "Texts.txt"
+        file_b = tmp_path / "b" / "Texts.txt"
+        for queue_file, own in ((file_a, "a"), (file_b, "b")):
+            queue_file.parent.mkdir()
+            queue_file.write_text(f"{shared}\nhttps://example.com/{own}\n")
+        config = ServiceConfig(
+            sources=[
+                SourceConfig(type="file", name="a", file=str(file_a)),
+                SourceConfig(type="file", name="b", file=str(file_b)),
+            ],
+        )
+        config.processing.audio.output_dir = str(tmp_path / "audio")
+
+        handlers = {s: signal.getsignal(s) for s in (signal.SIGINT, signal.SIGTERM)}
+        try:
+            service = service_daemon.TextcastService(config)
+            service._process_file_queues_bulk(config.sources)
+        finally:
+            for signum, handler in handlers.items():
+                signal.signal(signum, handler)
+
+        assert file_a.read_text() == ""
+        assert file_b.read_text() == ""
+
+
+class TestTimedMemoryHandler:
+    """Tests for the buffered log file handler."""
+
+    def test_close_writes_buffered_records(self, tmp_path):
+        """Test that records still buffered at close reach the file."""
+        log_file = tmp_path / "textcast.log"
+        target = logging.FileHandler(log_file)
+        handler = service_daemon._TimedMemoryHandler(
+            100, 60.0, flushLevel=logging.ERROR, target=target, flushOnClose=True
+        )
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "hello", (), None)
+
+        handler.handle(record)
+        handler.close()
+        target.close()
+
+        assert log_file.read_text() == "hello\n"
+        assert not handler._flusher.is_alive()
@@ -5,23 +5,29 @@ Audiobookshelf client for uploading audio files.
 import json
 import logging
 import os
-import time
-import urllib.error
-import urllib.parse
-import urllib.request
+from contextlib import ExitStack
 from pathlib import Path
 from typing import Optional
 
+import requests
+
 logger = logging.getLogger(__name__)
 
 
 class AudiobookshelfClient:
     """Client for interacting with the Audiobookshelf API."""
 
-    def __init__(self, api_key: str, base_url: str):
-        """Initialize the client with API key and base URL."""
+    def __init__(
+        self, api_key: str, base_url: str, session: Optional[requests.Session] = None
+    ):
+        """Initialize the client with API key and base URL.
+
+        Pass a shared session to reuse its pooled keep-alive connections;
+        otherwise the client opens its own.
+        """
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
+        self.session = session if session is not None else requests.Session()
 
     def get_libraries(self):
         """Fetch all libraries from Audiobookshelf."""
@@ -114,84 +120,48 @@ class AudiobookshelfClient:
 
         try:
             if files:
-                # Handle file uploads with multipart/form-data
-                boundary = "----boundary" + str(int(time.time()))
-                headers["Content-Type"] = f"multipart/form-data; boundary={boundary}"
-
-                # Create multipart body
-                body = []
-
-                # Add regular form fields
-                if data:
-                    for key, value in data.items():
-                        body.append(f"--{boundary}".encode())
-                        body.append(
-                            f'Content-Disposition: form-data; name="{key}"'.encode()
+                # Files go out as '0', '1', ... (matching curl's -F 0=@file.mp3 format)
+                with ExitStack() as stack:
+                    multipart = {
+                        str(i): (
+                            file_name,
+                            stack.enter_context(open(file_path, "rb")),
+                            "application/octet-stream",
                         )
-                        body.append(b"")
-                        body.append(str(value).encode())
-
-                # Add file as '0' parameter (matching curl's -F 0=@file.mp3 format)
-                for i, (file_path, file_name) in enumerate(files.items()):
-                    body.append(f"--{boundary}".encode())
-                    body.append(
-                        f'Content-Disposition: form-data; name="{i}"; filename="{file_name}"'.encode()
+                        for i, (file_path, file_name) in enumerate(files.items())
+                    }
+                    response = self.session.request(
+                        method, url, headers=headers, data=data, files=multipart
                     )
-                    body.append(b"Content-Type: application/octet-stream")
-                    body.append(b"")
-
-                    with open(file_path, "rb") as file:
-                        body.append(file.read())
-
-                # Close the multipart body
-                body.append(f"--{boundary}--".encode())
-                body.append(b"")
-
-                # Join with CRLF as per HTTP spec
-                data = b"\r\n".join(body)
-                request = urllib.request.Request(
-                    url, data=data, headers=headers, method=method
-                )
-
             elif data:
-                # For regular JSON requests
-                headers["Content-Type"] = "application/json"
-                json_data = json.dumps(data).encode("utf-8")
-                request = urllib.request.Request(
-                    url, data=json_data, headers=headers, method=method
-                )
+                response = self.session.request(method, url, headers=headers, json=data)
             else:
-                # Simple GET request
-                request = urllib.request.Request(url, headers=headers, method=method)
-
-            # Send the request and handle the response
-            with urllib.request.urlopen(request) as response:
-                response_data = response.read().decode("utf-8")
-                if not response_data:
-                    return None
-
-                try:
-                    return json.loads(response_data)
-                except json.JSONDecodeError:
-                    return response_data
-
-        except urllib.error.HTTPError as e:
-            # Handle HTTP errors (4xx, 5xx)
-            error_message = e.read().decode("utf-8")
+                response = self.session.request(method, url, headers=headers)
+        except requests.RequestException as e:
+            logger.error(f"Audiobookshelf URL Error: {e}")
+            raise Exception(f"Audiobookshelf connection failed: {e}")
+
+        if response.status_code >= 400:
+            error_message = response.text
             try:
                 error_data = json.loads(error_message)
                 logger.error(
                     f"Audiobookshelf API error: {error_data.get('error', error_message)}"
                 )
-            except json.JSONDecodeError:
-                logger.error(f"Audiobookshelf HTTP Error: {e.code} - {error_message}")
-            raise Exception(f"Audiobookshelf upload failed: {e.code} - {error_message}")
-        except urllib.error.URLError as e:
-            logger.error(f"Audiobookshelf URL Error: {e.reason}")
-            raise Exception(f"Audiobookshelf connection failed: {e.reason}")
-        except Exception as e:
-            logger.error(f"Audiobookshelf Error: {str(e)}")
-            raise
+            except (json.JSONDecodeError, AttributeError):
+                logger.error(
+                    f"Audiobookshelf HTTP Error: {response.status_code} - {error_message}"
+                )
+            raise Exception(
+                f"Audiobookshelf upload failed: {response.status_code} - {error_message}"
+            )
+
+        if not response.content:
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            return response.text
 
     def upload_file(
         self,
@@ -263,6 +233,7 @@ def upload_to_audiobookshelf(
     library: Optional[str] = None,
     folder_id: Optional[str] = None,
     title: Optional[str] = None,
+    session: Optional[requests.Session] = None,
 ) -> bool:
     """
     Upload an audio file to Audiobookshelf.
@@ -273,6 +244,7 @@ def upload_to_audiobookshelf(
         library: Library name (e.g., "Podcasts") or library ID (UUID). If not specified, uses first available library.
         folder_id: Optional folder ID (auto-detected)
         title: Optional title for the upload
+        session: Optional requests session to reuse pooled connections
 
     Returns:
         bool: True if upload was successful, False otherwise
@@ -285,7 +257,7 @@ def upload_to_audiobookshelf(
             return False
 
         # Create client and upload
-        client = AudiobookshelfClient(api_key, abs_url)
+        client = AudiobookshelfClient(api_key, abs_url, session=session)
         response = client.upload_file(file_path, library, folder_id, title)
 
         if response:
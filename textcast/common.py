@@ -2,16 +2,19 @@ import logging
 import os
 import random
 import re
+import stat
 import string
+import tempfile
 import uuid
 from pathlib import Path
 from typing import List, Optional, Union
 
 import click
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .audiobookshelf import upload_to_audiobookshelf
-from .elevenlabs import process_text_to_audio_elevenlabs
-from .openai import process_text_to_audio_openai
 from .podservice import upload_to_podservice
 from .service_config import AudiobookshelfDestination, PodserviceDestination
 
@@ -74,6 +77,56 @@ def generate_lowercase_string():
     return result
 
 
+def remove_lines_from_file(path: str, lines_to_remove: set):
+    """Drop lines whose stripped text is in ``lines_to_remove`` from a file.
+
+    Streams the kept lines into a temp file next to ``path`` and swaps it
+    in with os.replace, so a crash mid-rewrite never truncates the file.
+    Symlinks are followed, and the file keeps its mode and, where
+    permitted, its owner.
+    """
+    path = os.path.realpath(path)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path), prefix=".", suffix=".tmp"
+    )
+    try:
+        with open(path, "r") as src, os.fdopen(fd, "w", buffering=1 << 16) as dst:
+            for line in src:
+                if line.strip() not in lines_to_remove:
+                    dst.write(line)
+            st = os.fstat(src.fileno())
+        os.chmod(tmp_path, stat.S_IMODE(st.st_mode))
+        if hasattr(os, "chown"):
+            try:
+                os.chown(tmp_path, st.st_uid, st.st_gid)
+            except PermissionError:
+                pass  # Only root can give the file to another user
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def create_upload_session() -> requests.Session:
+    """Create an HTTP session that keeps upload connections alive.
+
+    Connections are pooled per host. Failed connects, and idempotent
+    requests answered with 429/5xx, are retried with backoff; uploads
+    themselves (POST) are not re-sent on an error status.
+    """
+    retry = Retry(
+        total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 def upload_to_destinations(
     file_path: Path,
     title: str,
@@ -88,6 +141,7 @@ def upload_to_destinations(
     abs_library: Optional[str] = None,
     abs_folder_id: Optional[str] = None,
     podservice_url: Optional[str] = None,
+    session: Optional[requests.Session] = None,
 ) -> bool:
     """Upload audio file to configured destinations.
 
@@ -100,6 +154,7 @@ def upload_to_destinations(
         image_url: Episode artwork URL
         abs_url, abs_library, abs_folder_id: Legacy Audiobookshelf params
         podservice_url: Legacy Podservice URL
+        session: Optional requests session shared across uploads
 
     Returns:
         True if any upload succeeded
@@ -123,6 +178,7 @@ def upload_to_destinations(
                         description=description,
                         source_url=source_url,
                         image_url=image_url,
+                        session=session,
                     )
                     if success:
                         logger.info("Successfully uploaded to Podservice!")
@@ -142,6 +198,7 @@ def upload_to_destinations(
                         library,
                         dest.folder_id or None,
                         title,
+                        session=session,
                     )
                     if success:
                         logger.info("Successfully uploaded to Audiobookshelf!")
@@ -155,7 +212,7 @@ def upload_to_destinations(
         if abs_url and abs_library:
             logger.info("Uploading to Audiobookshelf...")
             success = upload_to_audiobookshelf(
-                file_path, abs_url, abs_library, abs_folder_id, title
+                file_path, abs_url, abs_library, abs_folder_id, title, session=session
             )
             if success:
                 logger.info("Successfully uploaded to Audiobookshelf!")
@@ -172,6 +229,7 @@ def upload_to_destinations(
                 description=description,
                 source_url=source_url,
                 image_url=image_url,
+                session=session,
             )
             if success:
                 logger.info("Successfully uploaded to Podservice!")
@@ -207,6 +265,7 @@ def process_text_to_audio(
     source_url=None,  # Original article URL for GUID
     description=None,  # Episode description for podservice
     image_url=None,  # Episode artwork URL for podservice
+    session: Optional[requests.Session] = None,  # Shared HTTP session for uploads
 ):
     logger.info(f"Processing text to audio for title: {title}")
     logger.debug(
@@ -233,10 +292,15 @@ def process_text_to_audio(
     filename = Path(directory) / f"{stem}-{short_id}.{ext}"
     logger.debug(f"Output filename: {filename}")
 
+    # TTS SDKs are imported on use; upload-only callers never need them
     if vendor == "openai":
+        from .openai import process_text_to_audio_openai
+
         logger.info("Processing with OpenAI")
         process_text_to_audio_openai(text, filename, model, voice)
     elif vendor == "elevenlabs":
+        from .elevenlabs import process_text_to_audio_elevenlabs
+
         logger.info("Processing with ElevenLabs")
         process_text_to_audio_elevenlabs(text, filename, model, voice)
 
@@ -262,6 +326,7 @@ def process_text_to_audio(
                         description=description,
                         source_url=source_url,
                         image_url=image_url,
+                        session=session,
                     )
                     if success:
                         logger.info("Successfully uploaded to Podservice!")
@@ -284,6 +349,7 @@ def process_text_to_audio(
                         library,
                         dest.folder_id or None,
                         title,
+                        session=session,
                     )
                     if success:
                         logger.info("Successfully uploaded to Audiobookshelf!")
@@ -308,7 +374,7 @@ def process_text_to_audio(
         if abs_url and abs_library:
             logger.info("Uploading to Audiobookshelf...")
             success = upload_to_audiobookshelf(
-                filename, abs_url, abs_library, abs_folder_id, title
+                filename, abs_url, abs_library, abs_folder_id, title, session=session
             )
             if success:
                 logger.info("Successfully uploaded to Audiobookshelf!")
@@ -330,6 +396,7 @@ def process_text_to_audio(
                 description=description,
                 source_url=source_url,
                 image_url=image_url,
+                session=session,
             )
             if success:
                 logger.info("Successfully uploaded to Podservice!")
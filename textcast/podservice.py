@@ -21,6 +21,7 @@ def upload_to_podservice(
     timeout: int = 120,
     max_retries: int = 3,
     retry_delay: float = 5.0,
+    session: Optional[requests.Session] = None,
 ) -> bool:
     """Upload audio file to podservice as a new episode.
 
@@ -34,17 +35,21 @@ def upload_to_podservice(
         timeout: Request timeout in seconds (default 120 for large files)
         max_retries: Maximum number of retry attempts for connection errors (default 3)
         retry_delay: Delay between retries in seconds (default 5.0)
+        session: Optional requests session to reuse pooled connections
 
     Returns:
         True if upload succeeded (including 409 duplicate), False otherwise
     """
-    if not file_path.exists():
+    try:
+        file_size = file_path.stat().st_size
+    except FileNotFoundError:
         logger.error(f"Audio file does not exist: {file_path}")
         return False
 
     # Normalize URL (remove trailing slash)
     podservice_url = podservice_url.rstrip("/")
     endpoint = f"{podservice_url}/api/episodes"
+    post = session.post if session is not None else requests.post
 
     last_error = None
     for attempt in range(max_retries):
@@ -57,9 +62,7 @@ def upload_to_podservice(
         try:
             logger.info(f"Uploading to podservice: {title}")
             logger.debug(f"Endpoint: {endpoint}")
-            logger.debug(
-                f"File: {file_path} ({file_path.stat().st_size / 1024 / 1024:.1f} MB)"
-            )
+            logger.debug(f"File: {file_path} ({file_size / 1024 / 1024:.1f} MB)")
 
             with open(file_path, "rb") as audio_file:
                 files = {"audio": (file_path.name, audio_file)}
@@ -73,7 +76,7 @@ def upload_to_podservice(
                 if image_url:
                     data["image_url"] = image_url
 
-                response = requests.post(
+                response = post(
                     endpoint,
                     files=files,
                     data=data,
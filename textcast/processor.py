@@ -9,7 +9,11 @@ import click
 from .aggregator import detect_and_expand_aggregator
 from .audio_scrape import try_scrape_and_download
 from .download import download_audio
-from .common import process_text_to_audio, upload_to_destinations
+from .common import (
+    process_text_to_audio,
+    remove_lines_from_file,
+    upload_to_destinations,
+)
 from .condense import condense_text
 from .constants import MIN_CONTENT_LENGTH, SUSPICIOUS_TEXTS
 from .errors import ProcessingError
@@ -256,13 +260,7 @@ def _update_source_file(
 
         # Rewrite the source file once
         if urls_to_remove:
-            with open(file_url_list, "r") as f:
-                lines = f.readlines()
-
-            with open(file_url_list, "w") as f:
-                for line in lines:
-                    if line.strip() not in urls_to_remove:
-                        f.write(line)
+            remove_lines_from_file(file_url_list, urls_to_remove)
 
             logger.info(
                 f"Updated {file_url_list}: removed {len(urls_to_remove)} URL(s)"
@@ -272,6 +270,32 @@ def _update_source_file(
         logger.error(f"Failed to update source file: {str(e)}")
 
 
+def _update_source_files(
+    results: List[ProcessingResult],
+    aggregator_sources: Dict[str, str],
+    url_files: Dict[str, List[str]],
+    **kwargs,
+):
+    """Update several source files, each with the results of its own URLs.
+
+    A URL listed in more than one file is updated in every one of them.
+    """
+    for path in {p for paths in url_files.values() for p in paths}:
+        file_results = [
+            r
+            for r in results
+            if path in url_files.get(aggregator_sources.get(r.url, r.url), ())
+        ]
+        file_aggregators = {
+            article: agg
+            for article, agg in aggregator_sources.items()
+            if path in url_files.get(agg, ())
+        }
+        _update_source_file(
+            file_results, file_aggregators, **{**kwargs, "file_url_list": path}
+        )
+
+
 def process_texts(urls: List[str], **kwargs) -> List[ProcessingResult]:
     """
     Process a list of text URLs, converting them to audio.
@@ -279,12 +303,16 @@ def process_texts(urls: List[str], **kwargs) -> List[ProcessingResult]:
     Args:
         urls: List of URLs to process
         **kwargs: Additional arguments from CLI (condense, text_model, condense_ratio, workers, etc.)
+            ``url_files`` maps each URL to the source files it came from, for
+            batches drawn from several files; otherwise ``file_url_list``
+            names the single source file.
 
     Returns:
         List[ProcessingResult]: Results of processing each text
     """
     workers = kwargs.get("workers", 5)
     auto_detect_aggregator = kwargs.get("auto_detect_aggregator", True)
+    url_files = kwargs.pop("url_files", None)
 
     # Expand aggregator URLs (sequential — fast, must happen first)
     expanded_urls = []
@@ -341,12 +369,15 @@ def process_texts(urls: List[str], **kwargs) -> List[ProcessingResult]:
                 results.append(result)
 
     # Batch file updates after all processing
-    _update_source_file(results, aggregator_sources, **kwargs)
+    if url_files:
+        _update_source_files(results, aggregator_sources, url_files, **kwargs)
+    else:
+        _update_source_file(results, aggregator_sources, **kwargs)
 
     # Log summary
-    successful = sum(1 for r in results if r.success)
-    failed = sum(1 for r in results if not r.success and not r.skipped)
-    skipped = sum(1 for r in results if r.skipped)
+    successful = sum(r.success for r in results)
+    skipped = sum(r.skipped for r in results)
+    failed = len(results) - successful - skipped  # Skipped results are never successful
 
     logger.info("Processing Summary:")
     logger.info(f"Successfully processed: {successful}")
@@ -1,13 +1,16 @@
 """HTTP server for adding URLs via web interface."""
 
+import gzip
 import logging
+import queue
 import threading
+import time
+from typing import List
 
 from flasgger import Swagger
 from flask import Flask, jsonify, redirect, request
+from markupsafe import escape
 
-from .common import process_text_to_audio
-from .condense import condense_text
 from .service_config import ServiceConfig
 
 logger = logging.getLogger(__name__)
@@ -37,6 +40,21 @@ SWAGGER_TEMPLATE = {
     "basePath": "/",
 }
 
+# Response compression settings
+COMPRESS_MIMETYPES = {"text/html", "application/json"}
+COMPRESS_LEVEL = 6
+COMPRESS_MIN_SIZE = 500
+
+# Status banners for the index page (user-controlled values must be escaped)
+_SUCCESS_HTML_FMT = '<div style="padding: 10px; background-color: #d4edda; color: #155724; border: 1px solid #c3e6cb; border-radius: 4px; margin-bottom: 20px;">✓ {msg}</div>'
+_ERROR_HTML_FMT = '<div style="padding: 10px; background-color: #f8d7da; color: #721c24; border: 1px solid #f5c6cb; border-radius: 4px; margin-bottom: 20px;">✗ Error: {err}</div>'
+
+# Maximum number of URL submissions waiting to be written to the texts file
+URL_QUEUE_MAX = 1000
+
+# Seconds stop() waits for queued URLs to be written to the texts file
+URL_FLUSH_TIMEOUT = 5.0
+
 
 class TextcastServer:
     """HTTP server for web-based URL submission."""
@@ -48,8 +66,33 @@ class TextcastServer:
         self._is_running = is_running
         self.app = Flask(__name__)
         self.swagger = Swagger(self.app, config=SWAGGER_CONFIG, template=SWAGGER_TEMPLATE)
+        self.app.after_request(self._compress_response)
         self._setup_routes()
         self.server_thread = None
+        self._url_queue = queue.Queue(maxsize=URL_QUEUE_MAX)
+        self._url_writer_thread = None
+        self._url_writer_lock = threading.Lock()
+        self._url_writer_stopped = False  # Set once stop() has drained the queue
+
+    def _compress_response(self, response):
+        """Gzip-encode text responses when the client accepts it."""
+        if (
+            response.direct_passthrough
+            or response.status_code != 200
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in COMPRESS_MIMETYPES
+            or not request.accept_encodings["gzip"]
+        ):
+            return response
+
+        data = response.get_data()
+        if len(data) < COMPRESS_MIN_SIZE:
+            return response
+
+        response.set_data(gzip.compress(data, compresslevel=COMPRESS_LEVEL))
+        response.headers["Content-Encoding"] = "gzip"
+        response.vary.add("Accept-Encoding")
+        return response
 
     def _get_texts_file(self) -> str:
         """Get the path to the Texts.txt file from the first file source."""
@@ -58,9 +101,72 @@ class TextcastServer:
                 return source.file
         raise ValueError("No enabled file source found in configuration")
 
+    def _enqueue_urls(self, texts_file: str, urls: List[str]) -> None:
+        """Queue URLs to be appended to the texts file by the writer thread.
+
+        Raises queue.Full when too many submissions are already waiting.
+        Once the server is stopping, the URLs are written directly instead.
+        """
+        with self._url_writer_lock:
+            # Queued under the lock, so nothing lands behind stop()'s sentinel
+            if not self._url_writer_stopped:
+                if self._url_writer_thread is None:
+                    self._url_writer_thread = threading.Thread(
+                        target=self._url_writer, daemon=True
+                    )
+                    self._url_writer_thread.start()
+                self._url_queue.put_nowait((texts_file, urls))
+                return
+        self._append_urls(texts_file, urls)
+
+    @staticmethod
+    def _append_urls(texts_file: str, urls: List[str]) -> None:
+        """Append URLs to the texts file with a single write, logging failures."""
+        try:
+            with open(texts_file, "a") as f:
+                f.write("".join(f"{url}\n" for url in urls))
+        except Exception as e:
+            logger.error(
+                f"Error writing {len(urls)} URL(s) to {texts_file}: {e}",
+                exc_info=True,
+            )
+
+    def _url_writer(self) -> None:
+        """Drain queued URLs, appending each batch with a single write per file.
+
+        Returns after writing the batch that contains the None sentinel.
+        """
+        stopping = False
+        while not stopping:
+            batch = [self._url_queue.get()]
+            while True:
+                try:
+                    batch.append(self._url_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            by_file = {}
+            for item in batch:
+                if item is None:
+                    stopping = True
+                    continue
+                texts_file, urls = item
+                by_file.setdefault(texts_file, []).extend(urls)
+
+            for texts_file, urls in by_file.items():
+                self._append_urls(texts_file, urls)
+
+            for _ in batch:
+                self._url_queue.task_done()
+
     def _process_text_in_background(self, text: str, title: str, text_config) -> None:
         """Spawn a background thread to condense text and convert to audio."""
         def _worker():
+            # Imported here so the daemon doesn't load the LLM/TTS SDKs
+            # until text is actually submitted
+            from .common import process_text_to_audio
+            from .condense import condense_text
+
             if self._is_running and not self._is_running():
                 logger.warning(f"Service shutting down, skipping processing of: {title}")
                 return
@@ -117,15 +223,13 @@ class TextcastServer:
         target_ratio: float,
     ) -> str:
         """Render the debug result page showing condensed text."""
-        import html
-
-        escaped_original = html.escape(original_text)
-        escaped_processed = html.escape(processed_text)
+        escaped_original = escape(original_text)
+        escaped_processed = escape(processed_text)
 
         return f"""
         <html>
         <head>
-            <title>Debug Result - {html.escape(title)}</title>
+            <title>Debug Result - {escape(title)}</title>
             <meta name="viewport" content="width=device-width, initial-scale=1.0">
             <style>
                 body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; max-width: 1200px; margin: 50px auto; padding: 20px; background-color: #fff; color: #333; }}
@@ -167,7 +271,7 @@ class TextcastServer:
         <body>
             <div class="back-link"><a href="/">&larr; Back to Textcast</a></div>
             <h1>Debug Result</h1>
-            <h2>{html.escape(title)}</h2>
+            <h2>{escape(title)}</h2>
 
             <div class="stats">
                 <div class="stats-grid">
@@ -228,12 +332,15 @@ class TextcastServer:
 
             message = ""
             if success_text:
-                message = '<div style="padding: 10px; background-color: #d4edda; color: #155724; border: 1px solid #c3e6cb; border-radius: 4px; margin-bottom: 20px;">✓ Text submitted for processing! Audio will be generated in the background.</div>'
+                message = _SUCCESS_HTML_FMT.format(
+                    msg="Text submitted for processing! Audio will be generated in the background."
+                )
             elif success:
-                message = '<div style="padding: 10px; background-color: #d4edda; color: #155724; border: 1px solid #c3e6cb; border-radius: 4px; margin-bottom: 20px;">✓ URL added successfully! Processing will start automatically.</div>'
+                message = _SUCCESS_HTML_FMT.format(
+                    msg="URL added successfully! Processing will start automatically."
+                )
             elif error:
-                import html as html_mod
-                message = f'<div style="padding: 10px; background-color: #f8d7da; color: #721c24; border: 1px solid #f5c6cb; border-radius: 4px; margin-bottom: 20px;">✗ Error: {html_mod.escape(error)}</div>'
+                message = _ERROR_HTML_FMT.format(err=escape(error))
 
             return f"""
             <html>
@@ -350,9 +457,16 @@ class TextcastServer:
                 # Get texts file path
                 texts_file = self._get_texts_file()
 
-                # Append URL to texts file
-                with open(texts_file, "a") as f:
-                    f.write(f"{url}\n")
+                # Hand off to the writer thread instead of blocking on disk I/O
+                try:
+                    self._enqueue_urls(texts_file, [url])
+                except queue.Full:
+                    logger.warning(f"URL queue full, rejecting: {url}")
+                    return (
+                        "Server busy, please retry later",
+                        503,
+                        {"Retry-After": "5"},
+                    )
 
                 logger.info(f"URL added via web interface: {url}")
                 return redirect("/?success=1")
@@ -391,6 +505,8 @@ class TextcastServer:
                         processed_text = text
 
                         if text_config.strategy == "condense":
+                            from .condense import condense_text
+
                             logger.info(f"Debug: Condensing text for: {title}")
                             processed_text = condense_text(
                                 text,
@@ -486,6 +602,8 @@ class TextcastServer:
                       type: string
               500:
                 description: Server error
+              503:
+                description: Too many submissions waiting, retry later
             """
             try:
                 data = request.get_json(silent=True)
@@ -511,11 +629,22 @@ class TextcastServer:
                         "error": f"Invalid URL(s) (must start with http:// or https://): {invalid_urls}"
                     }), 400
 
-                # Append URLs to texts file
+                # Hand off to the writer thread, as /add-url does
                 texts_file = self._get_texts_file()
-                with open(texts_file, "a") as f:
-                    for url in urls:
-                        f.write(f"{url}\n")
+                try:
+                    self._enqueue_urls(texts_file, urls)
+                except queue.Full:
+                    logger.warning(f"URL queue full, rejecting {len(urls)} URL(s)")
+                    return (
+                        jsonify(
+                            {
+                                "success": False,
+                                "error": "Server busy, please retry later",
+                            }
+                        ),
+                        503,
+                        {"Retry-After": "5"},
+                    )
 
                 logger.info(f"Added {len(urls)} URL(s) via API")
                 return jsonify({
@@ -654,8 +783,30 @@ class TextcastServer:
 
         logger.info(f"Web interface available at: {self.config.server.base_url}")
 
+    def _stop_url_writer(self) -> None:
+        """Write out queued URLs, waiting at most URL_FLUSH_TIMEOUT seconds."""
+        with self._url_writer_lock:
+            self._url_writer_stopped = True
+            thread, self._url_writer_thread = self._url_writer_thread, None
+        if thread is None:
+            return
+
+        deadline = time.monotonic() + URL_FLUSH_TIMEOUT
+        try:
+            self._url_queue.put(None, timeout=URL_FLUSH_TIMEOUT)
+        except queue.Full:
+            pass
+        thread.join(max(0.0, deadline - time.monotonic()))
+        if thread.is_alive():
+            logger.warning(
+                f"Timed out writing submitted URLs; {self._url_queue.qsize()} "
+                "still queued"
+            )
+
     def stop(self):
         """Stop the server."""
         logger.info("Stopping HTTP server...")
+        # URLs were acknowledged to the user as added, so get them on disk
+        self._stop_url_writer()
         # Flask doesn't have a clean way to stop from another thread
         # The daemon thread will be terminated when the main program exits
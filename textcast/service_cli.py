@@ -2,11 +2,12 @@
 Service CLI commands for textcast daemon mode.
 """
 
+import codecs
 import logging
 import signal
 import subprocess
 import sys
-import time
+import threading
 from pathlib import Path
 
 import click
@@ -16,6 +17,9 @@ from .service_daemon import check_sources_once, run_service
 
 logger = logging.getLogger(__name__)
 
+# Pipe read size for relaying the child service output
+READ_CHUNK_SIZE = 65536
+
 
 @click.group()
 @click.option("--config", type=click.Path(), help="Path to configuration file")
@@ -319,17 +323,29 @@ def _run_service_with_watcher(config_path, log_file=None):
                     cmd,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
-                    universal_newlines=True,
-                    bufsize=1,
+                    bufsize=READ_CHUNK_SIZE,
                 )
 
-                # Print output in real-time
-                import threading
+                # Print output in real-time. Read whatever is available in
+                # one call (up to READ_CHUNK_SIZE) and split lines ourselves
+                # rather than issuing one read per line.
+                stdout = self.process.stdout
 
                 def print_output():
-                    for line in iter(self.process.stdout.readline, ""):
-                        if line:
+                    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                    leftover = ""
+                    while True:
+                        chunk = stdout.read1(READ_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        *lines, leftover = (leftover + decoder.decode(chunk)).split(
+                            "\n"
+                        )
+                        for line in lines:
                             click.echo(line.rstrip())
+                    leftover += decoder.decode(b"", final=True)
+                    if leftover:
+                        click.echo(leftover.rstrip())
 
                 output_thread = threading.Thread(target=print_output, daemon=True)
                 output_thread.start()
@@ -352,24 +368,26 @@ def _run_service_with_watcher(config_path, log_file=None):
     observer = Observer()
     observer.schedule(handler, str(config_path.parent), recursive=False)
 
-    # Handle Ctrl+C gracefully
+    # Handle Ctrl+C gracefully - the main thread blocks on stop_event
+    # instead of polling, so shutdown happens as soon as a signal arrives
+    stop_event = threading.Event()
+
     def signal_handler(signum, frame):
-        click.echo("\n🛑 Received interrupt signal")
-        handler.stop()
-        observer.stop()
-        sys.exit(0)
+        stop_event.set()
 
     signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
 
     # Start watching
     observer.start()
 
     try:
-        while True:
-            time.sleep(1)
+        stop_event.wait()
     except KeyboardInterrupt:
-        signal_handler(None, None)
+        pass
     finally:
+        click.echo("\n🛑 Received interrupt signal")
+        handler.stop()
         observer.stop()
         observer.join()
 
@@ -2,15 +2,34 @@
 Service configuration for textcast daemon mode.
 """
 
+import copy
+import hashlib
+import logging
 import os
 import platform
-import re
-from dataclasses import dataclass, field
+import stat
+import sys
+import threading
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import yaml
 
+logger = logging.getLogger(__name__)
+
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with them
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Slotted dataclasses (Python 3.10+) use less memory and have faster
+# attribute access; older interpreters fall back to regular dataclasses
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Minutes per interval unit (seconds are handled separately)
+_INTERVAL_MINUTES = {"m": 1, "h": 60, "d": 60 * 24}
+
 
 def parse_interval(value: Union[str, int]) -> int:
     """Parse interval value with required time unit suffix.
@@ -23,50 +42,34 @@ def parse_interval(value: Union[str, int]) -> int:
     """
     if isinstance(value, int):
         # Legacy support - warn but allow
-        import logging
-
-        logger = logging.getLogger(__name__)
         logger.warning(
             f"Using bare number {value} for interval is deprecated. Please use time units like '{value}m'"
         )
         return value
 
     if isinstance(value, str):
-        # Try to parse string with time unit
-        match = re.match(r"^(\d+)([smhd])$", value.strip().lower())
-        if match:
-            number, unit = match.groups()
-            number = int(number)
+        value_str = value.strip().lower()
+        number, unit = value_str[:-1], value_str[-1:]
 
+        # Try to parse string with time unit
+        if number.isdecimal():
             if unit == "s":  # seconds
-                return max(1, number // 60)  # Convert to minutes, min 1 minute
-            elif unit == "m":  # minutes
-                return number
-            elif unit == "h":  # hours
-                return number * 60
-            elif unit == "d":  # days
-                return number * 60 * 24
+                return max(1, int(number) // 60)  # Convert to minutes, min 1 minute
+            if unit in _INTERVAL_MINUTES:
+                return int(number) * _INTERVAL_MINUTES[unit]
 
         # Check if it's a bare number string - reject it
-        try:
-            int(value.strip())
+        if value_str.isdecimal():
             raise ValueError(
                 f"Bare numbers not allowed for intervals. Use '{value}m' instead of '{value}'"
             )
-        except ValueError as e:
-            if "invalid literal" in str(e):
-                # It's not a number, fall through to main error
-                pass
-            else:
-                # It is a number, re-raise our custom error
-                raise
 
     raise ValueError(
         f"Invalid interval format: {value}. Use format like '5m', '1h', '30s' with required time unit."
     )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SourceConfig:
     """Configuration for a content source."""
 
@@ -89,9 +92,12 @@ class SourceConfig:
     # Common fields
     check_duplicates: bool = True
     processing_strategy: Optional[str] = None  # condense, full, or None for default
+    # Seconds between scans when polling instead of using OS file events;
+    # set for network mounts the OS can't watch (detected on Linux/Windows)
+    poll_interval: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TextProcessingConfig:
     """Configuration for text processing (condensing)."""
 
@@ -103,7 +109,7 @@ class TextProcessingConfig:
     condense_ratio: float = 0.5
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AudioProcessingConfig:
     """Configuration for audio generation (TTS)."""
 
@@ -116,7 +122,7 @@ class AudioProcessingConfig:
     output_dir: str = "/tmp/textcast-service"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProcessingConfig:
     """Configuration for processing with nested text and audio configs."""
 
@@ -125,7 +131,7 @@ class ProcessingConfig:
     workers: int = 5  # Number of parallel URL processing workers
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AudiobookshelfConfig:
     """Configuration for Audiobookshelf integration."""
 
@@ -136,7 +142,7 @@ class AudiobookshelfConfig:
     folder_id: str = ""  # Deprecated: auto-detected when using library_name
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PodserviceConfig:
     """Configuration for Podservice integration (legacy, use destinations instead)."""
 
@@ -144,7 +150,7 @@ class PodserviceConfig:
     url: str = ""  # Base URL of podservice (e.g., http://192.168.50.7:8083)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DestinationConfig:
     """Base configuration for a destination."""
 
@@ -152,14 +158,14 @@ class DestinationConfig:
     enabled: bool = True
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PodserviceDestination(DestinationConfig):
     """Configuration for Podservice destination."""
 
     url: str = ""  # Base URL of podservice
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AudiobookshelfDestination(DestinationConfig):
     """Configuration for Audiobookshelf destination."""
 
@@ -170,7 +176,7 @@ class AudiobookshelfDestination(DestinationConfig):
     folder_id: str = ""  # Deprecated: auto-detected when using library_name
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ServerConfig:
     """Configuration for web server."""
 
@@ -180,7 +186,7 @@ class ServerConfig:
     base_url: Optional[str] = None  # Auto-generated if not set
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ServiceConfig:
     """Main service configuration."""
 
@@ -198,35 +204,66 @@ class ServiceConfig:
     log_level: str = "INFO"
     log_file: Optional[str] = None
 
+    @property
+    def interval_str(self) -> str:
+        """check_interval formatted for display, e.g. 90 -> "1h30m"."""
+        days, rem = divmod(self.check_interval, 1440)
+        hours, minutes = divmod(rem, 60)
+        return "".join(
+            [
+                f"{days}d" if days else "",
+                f"{hours}h" if hours else "",
+                f"{minutes}m" if minutes or not (days or hours) else "",
+            ]
+        )
+
+
+# Parsed configs by path: ((content digest, env fallbacks), ServiceConfig)
+_CONFIG_CACHE: Dict[str, Tuple[tuple, ServiceConfig]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+_HOME = os.path.expanduser("~")
+_IS_DARWIN = platform.system() == "Darwin"
+
 
+@lru_cache(maxsize=1)
 def get_default_config_path() -> Path:
     """Get the default configuration file path."""
-    home = Path.home()
-
-    if platform.system() == "Darwin":
+    if _IS_DARWIN:
         # macOS
-        return (
-            home
-            / "Library"
-            / "Application Support"
-            / "textcast-service"
-            / "config.yaml"
+        return Path(
+            os.path.join(
+                _HOME,
+                "Library",
+                "Application Support",
+                "textcast-service",
+                "config.yaml",
+            )
         )
     else:
         # Linux and other Unix-like systems
-        return home / ".config" / "textcast-service" / "config.yaml"
+        return Path(os.path.join(_HOME, ".config", "textcast-service", "config.yaml"))
+
+
+def _get_abs_env() -> dict:
+    """Read Audiobookshelf settings from the environment."""
+    return {
+        "api_key": os.getenv("ABS_API_KEY", ""),
+        "url": os.getenv("ABS_URL", ""),
+    }
 
 
 def _parse_destinations(
     data: dict,
+    abs_env: Optional[dict] = None,
 ) -> List[Union[PodserviceDestination, AudiobookshelfDestination]]:
     """Parse destinations list from config data.
 
     Supports both new 'destinations:' format and legacy 'audiobookshelf:'/'podservice:' blocks.
+    ``abs_env`` holds env fallbacks from _get_abs_env(); read if not given.
     """
-    import logging
-
-    logger = logging.getLogger(__name__)
+    if abs_env is None:
+        abs_env = _get_abs_env()
     destinations = []
 
     # Check for new destinations format
@@ -242,14 +279,9 @@ def _parse_destinations(
                     )
                 )
             elif dest_type == "audiobookshelf":
-                # Get api_key from config or environment
-                api_key = dest_data.get("api_key", "")
-                if not api_key:
-                    api_key = os.getenv("ABS_API_KEY", "")
-                # Get url from config or environment
-                url = dest_data.get("url", "")
-                if not url:
-                    url = os.getenv("ABS_URL", "")
+                # Get api_key and url from config or environment
+                api_key = dest_data.get("api_key") or abs_env["api_key"]
+                url = dest_data.get("url") or abs_env["url"]
 
                 destinations.append(
                     AudiobookshelfDestination(
@@ -283,14 +315,9 @@ def _parse_destinations(
 
     # Check for legacy audiobookshelf block
     abs_data = data.get("audiobookshelf", {})
-    # Get api_key from config or environment
-    api_key = abs_data.get("api_key", "")
-    if not api_key:
-        api_key = os.getenv("ABS_API_KEY", "")
-    # Get url from config or environment
-    url = abs_data.get("url", "")
-    if not url:
-        url = os.getenv("ABS_URL", "")
+    # Get api_key and url from config or environment
+    api_key = abs_data.get("api_key") or abs_env["api_key"]
+    url = abs_data.get("url") or abs_env["url"]
 
     if url and api_key:
         has_legacy = True
@@ -315,25 +342,79 @@ def _parse_destinations(
     return destinations
 
 
+def _peek_root_is_mapping(raw: bytes) -> bool:
+    """Check whether a YAML document's top-level node is a mapping.
+
+    Streams parser events and stops at the first node, so a mis-pointed
+    file is rejected without composing the whole document.
+    """
+    for event in yaml.parse(raw, Loader=_YAML_LOADER):
+        if isinstance(event, yaml.NodeEvent):
+            return isinstance(event, yaml.MappingStartEvent)
+    return False
+
+
 def load_config(config_path: Optional[str] = None) -> ServiceConfig:
-    """Load service configuration from YAML file."""
+    """Load service configuration from YAML file.
+
+    Parsed configs are cached by file path and a BLAKE2b digest of the
+    contents (plus the environment fallbacks), so reloading an unchanged
+    file skips YAML parsing while any edit, even one that keeps the mtime
+    and size, is picked up. Each call returns its own copy, safe to mutate.
+    """
     if config_path is None:
         config_path = get_default_config_path()
-    else:
-        config_path = Path(config_path)
+    config_path = os.fspath(config_path)
 
-    if not config_path.exists():
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError:
         # Return default configuration
         return ServiceConfig()
+    if not stat.S_ISREG(st.st_mode):
+        raise Exception(
+            f"Failed to load configuration from {config_path}: not a regular file"
+        )
+
+    try:
+        with open(config_path, "rb") as f:
+            raw = f.read()
+    except OSError as e:
+        raise Exception(f"Failed to load configuration from {config_path}: {e}") from e
+
+    key = (
+        hashlib.blake2b(raw, digest_size=16).digest(),
+        tuple(_get_abs_env().items()),
+    )
+    with _CONFIG_CACHE_LOCK:
+        cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == key:
+        config = cached[1]
+    else:
+        config = _parse_config(config_path, raw, dict(key[1]))
+        with _CONFIG_CACHE_LOCK:
+            _CONFIG_CACHE[config_path] = (key, config)
+    return copy.deepcopy(config)
+
 
+def _parse_config(config_path: str, raw: bytes, abs_env: dict) -> ServiceConfig:
+    """Parse config file contents into a ServiceConfig."""
     try:
-        with open(config_path, "r") as f:
-            data = yaml.safe_load(f)
+        if not _peek_root_is_mapping(raw):
+            raise ValueError("top-level YAML value must be a mapping")
+
+        data = yaml.load(raw, Loader=_YAML_LOADER)
 
         # Parse sources
-        sources = []
-        for source_data in data.get("sources", []):
-            sources.append(SourceConfig(**source_data))
+        sources = [
+            SourceConfig(**source_data) for source_data in data.get("sources") or ()
+        ]
+        # Sources are looked up by name, so names must be unique
+        seen_names = set()
+        for source in sources:
+            if source.name in seen_names:
+                raise ValueError(f"duplicate source name: {source.name!r}")
+            seen_names.add(source.name)
 
         # Parse processing config with nested text and audio
         processing_data = data.get("processing", {})
@@ -375,15 +456,14 @@ def load_config(config_path: Optional[str] = None) -> ServiceConfig:
         )
 
         # Parse destinations (new format with backward compatibility)
-        destinations = _parse_destinations(data)
+        destinations = _parse_destinations(data, abs_env)
 
         # Parse legacy audiobookshelf config (for backward compatibility)
-        abs_data = data.get("audiobookshelf", {})
-        # Use environment variables if not provided in config (only for api_key and server)
-        if not abs_data.get("api_key"):
-            abs_data["api_key"] = os.getenv("ABS_API_KEY", "")
-        if not abs_data.get("url"):
-            abs_data["url"] = os.getenv("ABS_URL", "")
+        # Environment variables fill in api_key and url when empty in config
+        abs_data = {
+            **abs_env,
+            **{k: v for k, v in data.get("audiobookshelf", {}).items() if v},
+        }
         audiobookshelf = AudiobookshelfConfig(**abs_data)
 
         # Parse server config
@@ -410,8 +490,36 @@ def load_config(config_path: Optional[str] = None) -> ServiceConfig:
 
         return config
 
-    except Exception as e:
-        raise Exception(f"Failed to load configuration from {config_path}: {e}")
+    except (yaml.YAMLError, AttributeError, TypeError, ValueError) as e:
+        raise Exception(f"Failed to load configuration from {config_path}: {e}") from e
+
+
+@lru_cache(maxsize=None)
+def _to_dict_func(cls) -> Callable:
+    """Generate a function returning a dict of a dataclass type's fields.
+
+    The body is built once per class with direct attribute loads, so no
+    field reflection happens per serialized instance.
+    """
+    items = ", ".join(f"{f.name!r}: obj.{f.name}" for f in fields(cls))
+    namespace = {}
+    exec(f"def _to_dict(obj):\n    return {{{items}}}\n", namespace)
+    return namespace["_to_dict"]
+
+
+def _dataclass_to_dict(obj) -> dict:
+    """Shallow-convert a dataclass instance to a dict of its fields."""
+    return _to_dict_func(type(obj))(obj)
+
+
+# Serializers for each destination type; the YAML "type" tag comes from the class
+_DEST_SERIALIZERS = {
+    PodserviceDestination: lambda d: {**_dataclass_to_dict(d), "type": "podservice"},
+    AudiobookshelfDestination: lambda d: {
+        **_dataclass_to_dict(d),
+        "type": "audiobookshelf",
+    },
+}
 
 
 def _serialize_destinations(
@@ -420,75 +528,38 @@ def _serialize_destinations(
     """Serialize destinations list to dict format for YAML."""
     result = []
     for dest in destinations:
-        if isinstance(dest, PodserviceDestination):
-            result.append(
-                {
-                    "type": "podservice",
-                    "enabled": dest.enabled,
-                    "url": dest.url,
-                }
-            )
-        elif isinstance(dest, AudiobookshelfDestination):
-            result.append(
-                {
-                    "type": "audiobookshelf",
-                    "enabled": dest.enabled,
-                    "url": dest.url,
-                    "api_key": dest.api_key,
-                    "library_name": dest.library_name,
-                    "library_id": dest.library_id,
-                    "folder_id": dest.folder_id,
-                }
-            )
+        serializer = _DEST_SERIALIZERS.get(type(dest))
+        if serializer:
+            result.append(serializer(dest))
     return result
 
 
+def _serialize_source(source: SourceConfig) -> dict:
+    """Serialize a source, leaving out poll_interval unless it is set."""
+    data = _dataclass_to_dict(source)
+    if data["poll_interval"] is None:
+        del data["poll_interval"]
+    return data
+
+
 def save_config(config: ServiceConfig, config_path: Optional[str] = None) -> None:
     """Save service configuration to YAML file."""
     if config_path is None:
         config_path = get_default_config_path()
-    else:
-        config_path = Path(config_path)
+    config_path = os.fspath(config_path)
 
     # Ensure directory exists
-    config_path.parent.mkdir(parents=True, exist_ok=True)
+    os.makedirs(os.path.dirname(config_path) or ".", exist_ok=True)
 
     # Convert to dict
     data = {
         "check_interval": config.check_interval,
         "file_check_interval": config.file_check_interval,
-        "sources": [
-            {
-                "type": s.type,
-                "name": s.name,
-                "enabled": s.enabled,
-                "url": s.url,
-                "channel_id": s.channel_id,
-                "channel_handle": s.channel_handle,
-                "download_dir": s.download_dir,
-                "file": s.file,
-                "watch_dir": s.watch_dir,
-                "file_patterns": s.file_patterns,
-                "check_duplicates": s.check_duplicates,
-                "processing_strategy": s.processing_strategy,
-            }
-            for s in config.sources
-        ],
+        "sources": [_serialize_source(s) for s in config.sources],
         "processing": {
             "workers": config.processing.workers,
-            "text": {
-                "provider": config.processing.text.provider,
-                "model": config.processing.text.model,
-                "strategy": config.processing.text.strategy,
-                "condense_ratio": config.processing.text.condense_ratio,
-            },
-            "audio": {
-                "vendor": config.processing.audio.vendor,
-                "model": config.processing.audio.model,
-                "voice": config.processing.audio.voice,
-                "format": config.processing.audio.format,
-                "output_dir": config.processing.audio.output_dir,
-            },
+            "text": _dataclass_to_dict(config.processing.text),
+            "audio": _dataclass_to_dict(config.processing.audio),
         },
         "log_level": config.log_level,
         "log_file": config.log_file,
@@ -499,20 +570,11 @@ def save_config(config: ServiceConfig, config_path: Optional[str] = None) -> Non
         data["destinations"] = _serialize_destinations(config.destinations)
     else:
         # Fall back to legacy format if no destinations but legacy configs exist
-        data["audiobookshelf"] = {
-            "url": config.audiobookshelf.url,
-            "api_key": config.audiobookshelf.api_key,
-            "library_name": config.audiobookshelf.library_name,
-            "library_id": config.audiobookshelf.library_id,
-            "folder_id": config.audiobookshelf.folder_id,
-        }
-        data["podservice"] = {
-            "enabled": config.podservice.enabled,
-            "url": config.podservice.url,
-        }
+        data["audiobookshelf"] = _dataclass_to_dict(config.audiobookshelf)
+        data["podservice"] = _dataclass_to_dict(config.podservice)
 
     with open(config_path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, indent=2)
+        yaml.dump(data, f, Dumper=_YAML_DUMPER, default_flow_style=False, indent=2)
 
 
 def create_example_config(config_path: Optional[str] = None) -> None:
@@ -523,14 +585,24 @@ def create_example_config(config_path: Optional[str] = None) -> None:
     else:
         config_path = Path(config_path)
 
-    # If example config already exists, load it to preserve values like library_name
+    # If example config already exists, read it to preserve values like library_name.
+    # Only two keys are needed, so skip the full load_config() parse.
     existing_abs_config = {}
     if config_path.exists():
         try:
-            existing_config = load_config(str(config_path))
+            with open(config_path, "r") as f:
+                raw = yaml.load(f, Loader=_YAML_LOADER) or {}
+            abs_block = raw.get("audiobookshelf") or next(
+                (
+                    d
+                    for d in raw.get("destinations") or []
+                    if d.get("type") == "audiobookshelf"
+                ),
+                {},
+            )
             existing_abs_config = {
-                "url": existing_config.audiobookshelf.url,
-                "library_name": existing_config.audiobookshelf.library_name,
+                "url": abs_block.get("url") or _get_abs_env()["url"],
+                "library_name": abs_block.get("library_name", ""),
             }
         except Exception:
             pass  # If loading fails, use defaults
@@ -2,65 +2,251 @@
 Textcast service daemon for continuous content monitoring and processing.
 """
 
+import fnmatch
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import re
 import signal
 import sys
 import threading
 import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 # from .rss_monitor import NewsletterMonitor, YouTubeMonitor
-from .common import upload_to_destinations
-from .processor import process_texts
+from .audiobookshelf import process_url_to_audiobookshelf
+from .common import (
+    create_upload_session,
+    remove_lines_from_file,
+    upload_to_destinations,
+)
 from .server import TextcastServer
-from .service_config import ServiceConfig, SourceConfig, load_config
+from .service_config import (
+    AudiobookshelfDestination,
+    ServiceConfig,
+    SourceConfig,
+    load_config,
+)
 
 logger = logging.getLogger(__name__)
 
+AUDIO_EXTENSIONS = frozenset({".mp3", ".m4a", ".wav", ".ogg", ".flac"})
+
+# Filesystems whose changes native watchers can miss (writes from other hosts)
+NETWORK_FILESYSTEMS = frozenset({"cifs", "smb3", "smbfs", "nfs", "nfs4"})
+
+# Default scan interval in seconds for watched paths on network filesystems
+DEFAULT_POLL_INTERVAL = 5.0
+
+# Seconds without write events or size/mtime changes before a file on a
+# backend without close events is considered fully written
+UPLOAD_DEBOUNCE = 2.0
+
+# Record of orphan files already uploaded, kept in the audio output directory
+UPLOADED_CACHE_FILE = ".uploaded.json"
+
+# Seconds an uploaded file version is remembered, so a late watcher event or
+# the startup scan doesn't upload it again, and the most entries kept
+RECENT_UPLOAD_TTL = 600.0
+RECENT_UPLOAD_MAX = 10_000
+
+# Log records buffered before the file handler is written, and the longest
+# a buffered record may wait before being flushed
+LOG_BUFFER_CAPACITY = 512
+LOG_FLUSH_INTERVAL = 1.0
+
+
+@dataclass
+class _PendingUpload:
+    """A file whose write events are being coalesced before upload."""
+
+    path: Path
+    source: SourceConfig
+    first_seen: float
+    last_event: float
+    sample: Optional[Tuple[int, int]] = None  # (size, mtime_ns) at last check
+    timer: Optional[threading.Timer] = None
+
+
+def _stat_sample(path: Path) -> Optional[Tuple[int, int]]:
+    """Return a file's (size, mtime_ns), or None if it is gone."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _is_network_path(path: Path) -> bool:
+    """Best-effort check whether a path lives on a network filesystem.
+
+    Uses the mount table on Linux and the drive type on Windows; elsewhere
+    returns False and sources can set poll_interval explicitly.
+    """
+    path = os.path.realpath(path)
+    if sys.platform == "win32":
+        import ctypes
+
+        if path.startswith("\\\\"):  # UNC path
+            return True
+        drive_remote = 4
+        root = os.path.splitdrive(path)[0] + "\\"
+        return ctypes.windll.kernel32.GetDriveTypeW(root) == drive_remote
+
+    try:
+        with open("/proc/self/mounts", "r") as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return False
+
+    # The longest mount point containing the path decides; later entries
+    # win ties since they are mounted on top
+    best, fstype = "", None
+    for mount_point, fs in mounts:
+        mount_point = re.sub(
+            r"\\([0-7]{3})", lambda m: chr(int(m.group(1), 8)), mount_point
+        )
+        if path != mount_point and not path.startswith(mount_point.rstrip("/") + "/"):
+            continue
+        if len(mount_point) >= len(best):
+            best, fstype = mount_point, fs
+    return fstype in NETWORK_FILESYSTEMS
+
+
+def _compile_patterns(patterns: List[str]) -> re.Pattern:
+    """Compile glob patterns into one case-insensitive regex for file names."""
+    if not patterns:
+        return re.compile(r"(?!)")  # Matches nothing
+    return re.compile(
+        "|".join(f"(?:{fnmatch.translate(p)})" for p in patterns), re.IGNORECASE
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_process_texts():
+    """Import the text processor on first use.
+
+    It pulls in the LLM and TTS SDKs, which upload-only setups never need.
+    """
+    from .processor import process_texts
+
+    return process_texts
+
+
+class _TimedMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes on a fixed interval."""
+
+    def __init__(self, capacity, flush_interval, **kwargs):
+        super().__init__(capacity, **kwargs)
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            args=(flush_interval,),
+            name="log-flusher",
+            daemon=True,
+        )
+        self._flusher.start()
+
+    def _flush_periodically(self, flush_interval: float):
+        while not self._stop_flushing.wait(flush_interval):
+            self.flush()
+
+    def close(self):
+        """Stop the flusher and write out buffered records; leaves the target open."""
+        self._stop_flushing.set()
+        self._flusher.join()
+        self.flush()
+        super().close()
+
 
 class TextcastService:
     """Main service class for continuous content monitoring and processing."""
 
     def __init__(self, config: ServiceConfig):
         self.config = config
-        self.running = False
+        # Source-independent process_texts arguments; config is fixed after startup
+        self._base_kwargs = self._build_base_kwargs()
+        # Per-source arguments, built once for each enabled source; source names
+        # are unique (load_config rejects duplicates)
+        self._kwargs_by_source = {
+            s.name: self._build_source_kwargs(s) for s in config.sources if s.enabled
+        }
+        self._stop_event = threading.Event()  # Set once the service is shutting down
         self._shutdown_signal = None  # Track signal that triggered shutdown
         self._active_tasks = 0  # Count of in-progress processing tasks
         self._active_tasks_lock = threading.Lock()
+        self._tasks_idle = threading.Condition(self._active_tasks_lock)
         self.monitors: Dict[str, object] = {}
-        self.file_watchers = []  # Store file watchers
+        # Shared watchdog observers: None for the native backend, otherwise
+        # a polling observer per scan interval
+        self._observers: Dict[Optional[float], object] = {}
+        # Watcher-triggered uploads run one at a time on a single worker thread,
+        # fed (file_path, source) items; None stops it
+        self._upload_queue = queue.Queue()
+        self._upload_worker = None
+        self._uploads_in_flight = set()  # Paths queued or being uploaded
+        # In-flight paths written again since their upload started
+        self._uploads_dirty = set()
+        self._uploads_lock = threading.Lock()
+        # Files still being written, by path, until their events go quiet
+        self._pending_uploads: Dict[str, _PendingUpload] = {}
+        self._pending_lock = threading.Lock()
+        # Resolved path -> (expiry, mtime_ns) of uploads started recently,
+        # oldest first
+        self._recent_uploads: "OrderedDict[str, Tuple[float, int]]" = OrderedDict()
+        self._recent_uploads_lock = threading.Lock()
+        self._uploaded = None  # Orphans uploaded but not yet deleted, loaded lazily
+        self._uploaded_lock = threading.Lock()
+        # Keep-alive connections reused by every daemon-side upload
+        self._upload_session = create_upload_session()
+        self.file_watchers = []  # Names of sources with a watcher scheduled
         self.server = TextcastServer(
             config,
             on_task_begin=self._begin_task,
             on_task_end=self._end_task,
-            is_running=lambda: self.running,
+            is_running=lambda: not self._stop_event.is_set(),
         )
 
+        # Per-type handlers for watcher setup and for one-off checks
+        setup_dispatch = {
+            "rss": self._source_not_implemented,
+            "youtube": self._source_not_implemented,
+            # File sources are monitored by file watchers; upload_file_process
+            # queues are downloaded and uploaded to ABS
+            "file": self._setup_file_watcher,
+            "upload_file_process": self._setup_file_watcher,
+            # Upload sources are monitored by directory watchers
+            "upload": self._setup_upload_watcher,
+        }
+        self._source_dispatch = {
+            "rss": self._source_not_implemented,
+            "youtube": self._source_not_implemented,
+            "file": self._process_file_queue,
+            "upload_file_process": self._process_audio_file_queue,
+            "upload": self._process_existing_upload_files,
+        }
+
+        # Enabled sources grouped by type, in config order
+        self._sources_by_type: Dict[str, List[SourceConfig]] = defaultdict(list)
+
         # Initialize monitors for each source
         for source in config.sources:
             if not source.enabled:
                 continue
 
-            if source.type == "rss":
-                logger.warning(
-                    f"RSS source '{source.name}' configured but not implemented yet"
-                )
-            elif source.type == "youtube":
-                logger.warning(
-                    f"YouTube source '{source.name}' configured but not implemented yet"
-                )
-            elif source.type == "file":
-                # File sources will be monitored by file watchers
-                self._setup_file_watcher(source)
-            elif source.type == "upload_file_process":
-                # File sources for audio processing (download and upload to ABS)
-                self._setup_file_watcher(source)
-            elif source.type == "upload":
-                # Upload sources will be monitored by directory watchers
-                self._setup_upload_watcher(source)
+            self._sources_by_type[source.type].append(source)
+
+            setup = setup_dispatch.get(source.type)
+            if setup:
+                setup(source)
             else:
                 logger.warning(f"Unknown source type: {source.type} for {source.name}")
 
@@ -68,11 +254,189 @@ class TextcastService:
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
 
+    def _get_observer(self, poll_interval: Optional[float] = None):
+        """Return the shared watchdog observer, creating it on first use.
+
+        A single native observer means one inotify/FSEvents handle and one
+        dispatch thread no matter how many sources are watched. Sources that
+        need polling share one PollingObserver per poll_interval.
+        """
+        observer = self._observers.get(poll_interval)
+        if observer is None:
+            if poll_interval is None:
+                from watchdog.observers import Observer
+
+                observer = Observer()
+            else:
+                from watchdog.observers.polling import PollingObserver
+
+                observer = PollingObserver(timeout=poll_interval)
+            self._observers[poll_interval] = observer
+        return observer
+
+    @staticmethod
+    def _poll_interval_for(source: SourceConfig, path: Path) -> Optional[float]:
+        """Return the poll interval for a watched path, or None for OS events."""
+        if source.poll_interval:
+            return float(source.poll_interval)
+        if _is_network_path(path):
+            logger.info(
+                f"Source {source.name}: {path} is on a network filesystem, "
+                f"polling every {DEFAULT_POLL_INTERVAL:g}s"
+            )
+            return DEFAULT_POLL_INTERVAL
+        return None
+
+    def _coalesce_upload(self, file_path: Path, source: SourceConfig):
+        """Note a write to file_path; queue one upload after UPLOAD_DEBOUNCE quiet."""
+        key = str(file_path)
+        now = time.monotonic()
+        with self._pending_lock:
+            pending = self._pending_uploads.get(key)
+            if pending is not None:
+                pending.last_event = now
+                return
+            pending = _PendingUpload(file_path, source, first_seen=now, last_event=now)
+            self._pending_uploads[key] = pending
+        # Outside the lock, as stat can be slow on network mounts
+        pending.sample = _stat_sample(file_path)
+        self._schedule_pending_flush(pending, UPLOAD_DEBOUNCE)
+
+    def _schedule_pending_flush(self, pending: _PendingUpload, delay: float):
+        """Check the pending upload again after delay seconds."""
+        pending.timer = threading.Timer(
+            delay, self._flush_pending_upload, args=(str(pending.path),)
+        )
+        pending.timer.daemon = True
+        pending.timer.start()
+
+    def _flush_pending_upload(self, key: str):
+        """Queue a coalesced upload, or wait longer if the file is still changing."""
+        with self._pending_lock:
+            pending = self._pending_uploads.get(key)
+        if pending is None:
+            return
+        # Polling backends can go quiet between scans while a write goes on,
+        # so the file itself must also be unchanged since the last check
+        sample = _stat_sample(pending.path)
+        with self._pending_lock:
+            if self._pending_uploads.get(key) is not pending:
+                return
+            if sample is None:
+                del self._pending_uploads[key]
+                logger.debug(f"File {pending.path.name} is gone, not uploading it")
+                return
+            if sample != pending.sample:
+                pending.sample = sample
+                pending.last_event = time.monotonic()
+            quiet = time.monotonic() - pending.last_event
+            if quiet < UPLOAD_DEBOUNCE:
+                self._schedule_pending_flush(pending, UPLOAD_DEBOUNCE - quiet)
+                return
+            del self._pending_uploads[key]
+
+        logger.debug(
+            f"File {pending.path.name} quiet after "
+            f"{time.monotonic() - pending.first_seen:.1f}s, queueing upload"
+        )
+        self._queue_upload(pending.path, pending.source)
+
+    def _discard_pending_upload(self, file_path: Path):
+        """Stop coalescing events for a file that is already known complete."""
+        with self._pending_lock:
+            pending = self._pending_uploads.pop(str(file_path), None)
+        if pending is not None and pending.timer is not None:
+            pending.timer.cancel()
+
+    def _queue_upload(self, file_path: Path, source: SourceConfig):
+        """Hand a file to the upload worker, or mark it dirty if already queued."""
+        key = str(file_path)
+        with self._uploads_lock:
+            if key in self._uploads_in_flight:
+                logger.debug(
+                    f"{file_path.name} already queued for upload, rechecking it after"
+                )
+                self._uploads_dirty.add(key)
+                return
+            self._uploads_in_flight.add(key)
+        self._upload_queue.put((file_path, source))
+
+    def _claim_upload(self, key: str, mtime_ns: int) -> bool:
+        """Record an upload of a file version; False if it was uploaded recently."""
+        now = time.monotonic()
+        with self._recent_uploads_lock:
+            recent = self._recent_uploads
+            # All entries share one TTL, so expired ones are at the front
+            while recent:
+                oldest = next(iter(recent))
+                if recent[oldest][0] > now:
+                    break
+                del recent[oldest]
+            entry = recent.get(key)
+            if entry is not None and entry[1] == mtime_ns:
+                return False
+            recent[key] = (now + RECENT_UPLOAD_TTL, mtime_ns)
+            recent.move_to_end(key)
+            if len(recent) > RECENT_UPLOAD_MAX:
+                recent.popitem(last=False)
+            return True
+
+    def _release_upload(self, key: str):
+        """Forget a claimed upload that failed, so the file can be retried."""
+        with self._recent_uploads_lock:
+            self._recent_uploads.pop(key, None)
+
+    def _upload_worker_loop(self):
+        """Upload files queued by the upload watchers until given None."""
+        while True:
+            item = self._upload_queue.get()
+            if item is None:
+                return
+            file_path, source = item
+            key = str(file_path)
+            # The upload below sees every write made before this point
+            with self._uploads_lock:
+                self._uploads_dirty.discard(key)
+            try:
+                self._upload_queued_file(file_path, source)
+            except Exception as e:
+                logger.error(
+                    f"Error handling upload of {file_path.name}: {e}", exc_info=True
+                )
+            finally:
+                with self._uploads_lock:
+                    if key in self._uploads_dirty and not self._stop_event.is_set():
+                        # Written again meanwhile: keep it in flight and recheck
+                        self._uploads_dirty.discard(key)
+                        self._upload_queue.put((file_path, source))
+                    else:
+                        self._uploads_dirty.discard(key)
+                        self._uploads_in_flight.discard(key)
+
+    def _upload_queued_file(self, file_path: Path, source: SourceConfig):
+        """Upload one queued file; it is complete by the time it is queued."""
+        # Skip if service is shutting down
+        if self._stop_event.is_set():
+            logger.debug(f"Service shutting down, skipping upload of {file_path.name}")
+            return
+
+        # _upload_file_to_destinations skips files that are gone by now
+        logger.debug(f"File {file_path.name} is complete, proceeding with upload")
+        self._upload_file_to_destinations(file_path, source)
+
+    @staticmethod
+    def _observer_emits_close_events(observer) -> bool:
+        """Whether the observer backend reports files closed after writing."""
+        try:
+            from watchdog.observers.inotify import InotifyObserver
+        except Exception:  # not available on this platform's libc
+            return False
+        return isinstance(observer, InotifyObserver)
+
     def _setup_file_watcher(self, source: SourceConfig):
         """Set up file watcher for a file source."""
         try:
             from watchdog.events import FileSystemEventHandler
-            from watchdog.observers import Observer
         except ImportError:
             logger.warning(
                 "watchdog package not found. File sources will be checked via polling."
@@ -91,6 +455,11 @@ class TextcastService:
             file_path.parent.mkdir(parents=True, exist_ok=True)
             file_path.touch()
 
+        # Events arrive with paths under the scheduled directory, so an exact
+        # string match is the common case; resolve() only for anything else
+        target_str = str(file_path)
+        resolved_target = file_path.resolve()
+
         class FileSourceHandler(FileSystemEventHandler):
             def __init__(self, service_ref, source_config):
                 self.service = service_ref
@@ -101,7 +470,10 @@ class TextcastService:
                     return
 
                 # Check if the modified file is our target file
-                if Path(event.src_path).resolve() == file_path.resolve():
+                if (
+                    event.src_path == target_str
+                    or Path(event.src_path).resolve() == resolved_target
+                ):
                     logger.info(
                         f"File source {self.source.name} changed: {event.src_path}"
                     )
@@ -112,19 +484,16 @@ class TextcastService:
                         self.service._process_file_queue(self.source)
 
         handler = FileSourceHandler(self, source)
-        observer = Observer()
+        observer = self._get_observer(self._poll_interval_for(source, file_path.parent))
         observer.schedule(handler, str(file_path.parent), recursive=False)
 
-        self.file_watchers.append((observer, source.name))
+        self.file_watchers.append(source.name)
         logger.info(f"Set up file watcher for {source.name}: {source.file}")
 
     def _setup_upload_watcher(self, source: SourceConfig):
         """Set up directory watcher for an upload source."""
         try:
-            import fnmatch
-
             from watchdog.events import FileSystemEventHandler
-            from watchdog.observers import Observer
         except ImportError:
             logger.warning("watchdog package not found. Upload sources will not work.")
             return
@@ -138,105 +507,75 @@ class TextcastService:
         watch_path = Path(source.watch_dir)
 
         class UploadHandler(FileSystemEventHandler):
-            def __init__(self, service_ref, source_config):
+            def __init__(self, service_ref, source_config, close_events):
                 self.service = service_ref
                 self.source = source_config
-                self.pending_files = {}  # Track pending file uploads with timestamps
+                # inotify reports IN_CLOSE_WRITE, so the file is known to be
+                # complete; other backends fall back to the delayed check
+                self.close_events = close_events
+                self.pattern = _compile_patterns(source_config.file_patterns)
+
+            def _matches(self, file_path):
+                return self.pattern.match(file_path.name) is not None
+
+            def _start_upload(self, file_path):
+                logger.debug(
+                    f"Upload source {self.source.name}: file ready: {file_path}"
+                )
+                self.service._discard_pending_upload(file_path)
+                self.service._queue_upload(file_path, self.source)
+
+            def on_closed(self, event):
+                if event.is_directory:
+                    return
 
+                file_path = Path(event.src_path)
+                if self._matches(file_path):
+                    self._start_upload(file_path)
+
+            # Renames arrive as moves on every backend
+            def on_moved(self, event):
+                if event.is_directory:
+                    return
+
+                # Atomic rename into the watched tree: the file is already complete
+                file_path = Path(event.dest_path)
+                if self._matches(file_path):
+                    self._start_upload(file_path)
+
+            # Creates and writes for a path are coalesced and the file is
+            # uploaded once they stop arriving. With close events this only
+            # matters for files moved in from outside the watched tree, which
+            # arrive as a bare create; files written in place are picked up
+            # by on_closed first.
             def on_created(self, event):
                 if event.is_directory:
                     return
 
                 file_path = Path(event.src_path)
-                # Check if file matches any of the patterns
-                for pattern in self.source.file_patterns:
-                    if fnmatch.fnmatch(file_path.name.lower(), pattern.lower()):
-                        logger.info(
-                            f"Upload source {self.source.name}: new file detected: {file_path}"
-                        )
+                if not self._matches(file_path):
+                    return
+
+                logger.debug(
+                    f"Upload source {self.source.name}: new file detected: {file_path}"
+                )
+                self.service._coalesce_upload(file_path, self.source)
+
+            def on_modified(self, event):
+                if event.is_directory or self.close_events:
+                    return
 
-                        # Add debounce delay to prevent immediate processing during file creation
-                        import threading
-                        import time
-
-                        def delayed_upload():
-                            # FIXME: Wait 20 seconds to ensure file is completely written
-                            # TODO: Consider implementing a file watcher that waits for file to be written
-                            # or some other neat fix instead of hard-coded delay
-                            time.sleep(20)
-
-                            # Skip if service is shutting down
-                            if not self.service.running:
-                                logger.debug(
-                                    f"Service shutting down, skipping upload of {file_path.name}"
-                                )
-                                return
-
-                            # Check if file still exists before processing
-                            if file_path.exists():
-                                # Check file stability - ensure it hasn't been modified in the last 10 seconds
-                                try:
-                                    file_mtime = file_path.stat().st_mtime
-                                    current_time = time.time()
-
-                                    if current_time - file_mtime < 10:
-                                        logger.debug(
-                                            f"File {file_path.name} was recently modified, waiting for stability"
-                                        )
-                                        return
-
-                                    # Check if file is not currently being processed by another event
-                                    file_key = str(file_path)
-
-                                    # Skip if this file was recently processed (within 10 seconds)
-                                    if (
-                                        file_key in self.pending_files
-                                        and current_time - self.pending_files[file_key]
-                                        < 10
-                                    ):
-                                        logger.debug(
-                                            f"Skipping {file_path.name} - recently processed"
-                                        )
-                                        return
-
-                                    # Mark file as being processed
-                                    self.pending_files[file_key] = current_time
-
-                                    logger.info(
-                                        f"File {file_path.name} is stable, proceeding with upload"
-                                    )
-                                    self.service._upload_file_to_destinations(
-                                        file_path, self.source
-                                    )
-
-                                    # Clean up old entries to prevent memory leaks
-                                    old_entries = [
-                                        k
-                                        for k, v in self.pending_files.items()
-                                        if current_time - v > 60
-                                    ]
-                                    for k in old_entries:
-                                        del self.pending_files[k]
-
-                                except OSError as e:
-                                    logger.debug(
-                                        f"Error checking file {file_path.name}: {e}"
-                                    )
-                                    return
-                            else:
-                                logger.debug(
-                                    f"File {file_path.name} no longer exists, skipping upload"
-                                )
-
-                        # Start delayed upload in background thread
-                        threading.Thread(target=delayed_upload, daemon=True).start()
-                        break
-
-        handler = UploadHandler(self, source)
-        observer = Observer()
+                file_path = Path(event.src_path)
+                if self._matches(file_path):
+                    self.service._coalesce_upload(file_path, self.source)
+
+        observer = self._get_observer(self._poll_interval_for(source, watch_path))
+        handler = UploadHandler(
+            self, source, self._observer_emits_close_events(observer)
+        )
         observer.schedule(handler, str(watch_path), recursive=True)
 
-        self.file_watchers.append((observer, source.name))
+        self.file_watchers.append(source.name)
         logger.info(
             f"Set up upload watcher for {source.name}: {source.watch_dir} (patterns: {source.file_patterns})"
         )
@@ -253,6 +592,8 @@ class TextcastService:
             if self._active_tasks < 0:
                 logger.warning("_active_tasks went negative, correcting to 0")
                 self._active_tasks = 0
+            if self._active_tasks == 0:
+                self._tasks_idle.notify_all()
 
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully.
@@ -261,52 +602,22 @@ class TextcastService:
         reentrant call errors if the signal interrupts an ongoing log write.
         """
         self._shutdown_signal = signum
-        self.running = False
+        self._stop_event.set()
 
     def start(self):
         """Start the service daemon."""
         logger.info("Starting Textcast service daemon...")
 
-        # Show user-friendly interval
-        interval_min = self.config.check_interval
-        if interval_min < 60:
-            interval_str = f"{interval_min}m"
-        elif interval_min < 1440:  # Less than a day
-            hours = interval_min // 60
-            remaining_min = interval_min % 60
-            if remaining_min == 0:
-                interval_str = f"{hours}h"
-            else:
-                interval_str = f"{hours}h{remaining_min}m"
-        else:  # Days
-            days = interval_min // 1440
-            remaining_min = interval_min % 1440
-            if remaining_min == 0:
-                interval_str = f"{days}d"
-            else:
-                remaining_hours = remaining_min // 60
-                remaining_min = remaining_min % 60
-                interval_str = f"{days}d{remaining_hours}h" + (
-                    f"{remaining_min}m" if remaining_min else ""
-                )
-
+        by_type = self._sources_by_type
         enabled_sources = [s.name for s in self.config.sources if s.enabled]
         external_sources = []
-        file_sources = [
-            s.name for s in self.config.sources if s.enabled and s.type == "file"
-        ]
-        upload_file_sources = [
-            s.name
-            for s in self.config.sources
-            if s.enabled and s.type == "upload_file_process"
-        ]
-        upload_sources = [
-            s.name for s in self.config.sources if s.enabled and s.type == "upload"
-        ]
+        file_sources = [s.name for s in by_type["file"]]
+        upload_file_sources = [s.name for s in by_type["upload_file_process"]]
+        upload_sources = [s.name for s in by_type["upload"]]
 
         # Only show interval if external sources are enabled
         if external_sources:
-            logger.info(f"External sources check interval: {interval_str}")
+            logger.info(f"External sources check interval: {self.config.interval_str}")
 
         logger.info(f"Enabled sources: {enabled_sources}")
         logger.info(f"External sources (polled): {external_sources}")
@@ -314,16 +625,20 @@ class TextcastService:
         logger.info(f"Upload file sources (watched): {upload_file_sources}")
         logger.info(f"Upload sources (watched): {upload_sources}")
 
-        self.running = True
-
         try:
             # Start web server if enabled
             self.server.start()
 
-            # Start file watchers
-            for observer, source_name in self.file_watchers:
-                observer.start()
-                logger.info(f"Started file watcher for {source_name}")
+            # Start file watchers, and the worker that uploads what they find
+            if self._observers:
+                self._upload_worker = threading.Thread(
+                    target=self._upload_worker_loop, name="upload-worker", daemon=True
+                )
+                self._upload_worker.start()
+                for observer in self._observers.values():
+                    observer.start()
+                for source_name in self.file_watchers:
+                    logger.info(f"Started file watcher for {source_name}")
 
             # Upload any orphan audio files from previous failed uploads
             self._upload_orphan_audio_files()
@@ -333,46 +648,29 @@ class TextcastService:
                 self._check_external_sources()
 
             # Process existing file sources once
-            for source in self.config.sources:
-                if source.enabled and source.type == "file":
-                    self._process_file_queue(source)
-                elif source.enabled and source.type == "upload_file_process":
-                    self._process_audio_file_queue(source)
+            if by_type["file"]:
+                self._process_file_queues_bulk(by_type["file"])
+            for source in by_type["upload_file_process"]:
+                self._process_audio_file_queue(source)
 
             # Process existing files in upload directories once
-            for source in self.config.sources:
-                if source.enabled and source.type == "upload":
-                    self._process_existing_upload_files(source)
-
-            # Main loop - periodically retry orphan audio uploads and check external sources
-            orphan_interval = self.config.check_interval * 60  # in seconds
-            next_orphan_check = time.time() + orphan_interval
-
-            if external_sources:
-                while self.running:
-                    next_check = time.time() + (self.config.check_interval * 60)
+            for source in by_type["upload"]:
+                self._process_existing_upload_files(source)
 
-                    while time.time() < next_check and self.running:
-                        time.sleep(1)
+            # Main loop - periodically retry orphan audio uploads and check external sources.
+            # Block on the stop event between checks so idle periods cause no wakeups
+            # and shutdown takes effect as soon as a signal arrives.
+            check_interval = self.config.check_interval * 60  # in seconds
 
-                        # Check for orphan audio files periodically
-                        if time.time() >= next_orphan_check:
-                            self._upload_orphan_audio_files()
-                            next_orphan_check = time.time() + orphan_interval
-
-                    if self.running:
-                        self._check_external_sources()
-            else:
+            if not external_sources:
                 logger.info(
                     "No external sources enabled, entering idle mode (file/upload watchers active)"
                 )
-                while self.running:
-                    time.sleep(1)
 
-                    # Check for orphan audio files periodically
-                    if time.time() >= next_orphan_check:
-                        self._upload_orphan_audio_files()
-                        next_orphan_check = time.time() + orphan_interval
+            while not self._stop_event.wait(check_interval):
+                self._upload_orphan_audio_files()
+                if external_sources:
+                    self._check_external_sources()
 
         except KeyboardInterrupt:
             logger.info("Service interrupted by user")
@@ -386,20 +684,35 @@ class TextcastService:
                 )
 
             # Stop file watchers first to prevent new work from starting
-            for observer, source_name in self.file_watchers:
-                observer.stop()
-            # Wait for in-progress file watcher callbacks to complete
-            for observer, source_name in self.file_watchers:
-                observer.join()
-                logger.info(f"Stopped file watcher for {source_name}")
+            running_observers = [o for o in self._observers.values() if o.is_alive()]
+            if running_observers:
+                for observer in running_observers:
+                    observer.stop()
+                # Wait for in-progress file watcher callbacks to complete
+                for observer in running_observers:
+                    observer.join()
+                for source_name in self.file_watchers:
+                    logger.info(f"Stopped file watcher for {source_name}")
+
+            # Drop uploads still waiting for their writers to finish
+            with self._pending_lock:
+                for pending in self._pending_uploads.values():
+                    pending.timer.cancel()
+                self._pending_uploads.clear()
+
+            # Let the current upload finish; queued ones see the stop and return
+            if self._upload_worker is not None:
+                self._upload_queue.put(None)
+                self._upload_worker.join()
+            self._upload_session.close()
 
             # Wait for any remaining active tasks (e.g., server background threads)
             if self._active_tasks > 0:
                 logger.info(
                     f"Waiting for {self._active_tasks} active task(s) to finish..."
                 )
-                while self._active_tasks > 0:
-                    time.sleep(1)
+                with self._tasks_idle:
+                    self._tasks_idle.wait_for(lambda: self._active_tasks == 0)
                 logger.info("All active tasks completed")
 
             # Stop web server
@@ -409,7 +722,7 @@ class TextcastService:
 
     def stop(self):
         """Stop the service daemon."""
-        self.running = False
+        self._stop_event.set()
         self.server.stop()
 
     def _check_external_sources(self):
@@ -433,13 +746,18 @@ class TextcastService:
         """Check a single source for new content."""
         logger.debug(f"Checking source: {source.name} ({source.type})")
 
-        if source.type in ("rss", "youtube"):
-            logger.warning(f"Source type {source.type} not implemented yet")
-            return
+        handler = self._source_dispatch.get(source.type)
+        if handler:
+            handler(source)
+        else:
+            logger.warning(f"Unknown source type: {source.type} for {source.name}")
 
-        elif source.type == "file":
-            # File source - process existing queue
-            self._process_file_queue(source)
+    @staticmethod
+    def _source_not_implemented(source: SourceConfig):
+        """Warn about a source type that has no implementation yet."""
+        logger.warning(
+            f"Source '{source.name}' of type {source.type} is not implemented yet"
+        )
 
     def _process_urls_directly(self, urls: List[str], source: SourceConfig):
         """Process URLs directly without using intermediate files."""
@@ -456,10 +774,22 @@ class TextcastService:
         """Inner implementation of URL processing."""
         logger.info(f"Processing {len(urls)} URLs from {source.name}")
 
-        # Prepare processing arguments from nested config
+        kwargs = self._source_kwargs(source)
+
+        # Process the URLs
+        results = _get_process_texts()(urls, **kwargs)
+
+        # Log results
+        successful = sum(r.success for r in results)
+        failed = len(results) - successful
+        logger.info(
+            f"Processing complete for {source.name}: {successful} successful, {failed} failed"
+        )
+
+    def _build_base_kwargs(self) -> dict:
+        """Build the process_texts arguments shared by every source."""
         text_config = self.config.processing.text
         audio_config = self.config.processing.audio
-        source_strategy = source.processing_strategy or text_config.strategy
 
         kwargs = {
             "vendor": audio_config.vendor,
@@ -472,7 +802,6 @@ class TextcastService:
             "strip": None,
             "yes": True,  # Auto-approve processing
             "debug": False,
-            "condense": source_strategy == "condense",
             "condense_ratio": text_config.condense_ratio,
             "aggregator": False,
             "auto_detect_aggregator": True,
@@ -498,15 +827,19 @@ class TextcastService:
             if self.config.podservice.enabled and self.config.podservice.url:
                 kwargs["podservice_url"] = self.config.podservice.url
 
-        # Process the URLs
-        results = process_texts(urls, **kwargs)
+        return kwargs
 
-        # Log results
-        successful = sum(1 for r in results if r.success)
-        failed = len(results) - successful
-        logger.info(
-            f"Processing complete for {source.name}: {successful} successful, {failed} failed"
-        )
+    def _build_source_kwargs(self, source: SourceConfig) -> dict:
+        """Build process_texts arguments for a source."""
+        strategy = source.processing_strategy or self.config.processing.text.strategy
+        return {**self._base_kwargs, "condense": strategy == "condense"}
+
+    def _source_kwargs(self, source: SourceConfig) -> dict:
+        """Return a copy of the process_texts arguments for a source."""
+        kwargs = self._kwargs_by_source.get(source.name)
+        if kwargs is None:
+            return self._build_source_kwargs(source)
+        return dict(kwargs)
 
     def _has_any_destination(self) -> bool:
         """Check if any upload destination is configured."""
@@ -529,8 +862,6 @@ class TextcastService:
             return
         # Check new destinations format
         if self.config.destinations:
-            from .service_config import AudiobookshelfDestination
-
             for dest in self.config.destinations:
                 if isinstance(dest, AudiobookshelfDestination) and dest.api_key:
                     os.environ["ABS_API_KEY"] = dest.api_key
@@ -557,30 +888,51 @@ class TextcastService:
 
     def _upload_orphan_audio_files_inner(self):
         """Inner implementation of orphan audio file upload."""
-        output_dir = Path(self.config.processing.audio.output_dir)
-        if not output_dir.exists():
-            logger.debug(f"Output directory does not exist: {output_dir}")
-            return
+        output_dir = self.config.processing.audio.output_dir
 
         # Find audio files old enough to be considered orphans.
         # Skip files modified in the last 5 minutes to avoid racing with
         # in-flight TTS generation or upload attempts.
-        audio_extensions = {".mp3", ".m4a", ".wav", ".ogg", ".flac"}
         min_age_seconds = 300  # 5 minutes
         now = time.time()
         audio_files = []
-        for f in output_dir.iterdir():
-            if not f.is_file() or f.suffix.lower() not in audio_extensions:
-                continue
-            try:
-                if now - f.stat().st_mtime < min_age_seconds:
-                    logger.debug(
-                        f"Skipping recently modified file: {f.name}"
-                    )
+        already_uploaded = []
+        seen = set()
+        try:
+            entries = os.scandir(output_dir)
+        except FileNotFoundError:
+            logger.debug(f"Output directory does not exist: {output_dir}")
+            return
+        uploaded = self._get_uploaded_cache()
+        with entries:
+            for entry in entries:
+                # DirEntry caches the file type from the directory listing
+                if not entry.is_file(follow_symlinks=False):
                     continue
-            except OSError:
-                continue
-            audio_files.append(f)
+                if os.path.splitext(entry.name)[1].lower() not in AUDIO_EXTENSIONS:
+                    continue
+                seen.add(entry.name)
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                # Uploaded before but the delete failed; unless it was
+                # rewritten since, only the delete needs retrying
+                uploaded_at = uploaded.get(entry.name)
+                if uploaded_at is not None and mtime <= uploaded_at:
+                    already_uploaded.append(Path(entry.path))
+                    continue
+                if now - mtime < min_age_seconds:
+                    logger.debug(f"Skipping recently modified file: {entry.name}")
+                    continue
+                audio_files.append(Path(entry.path))
+
+        for name in uploaded.keys() - seen:
+            self._update_uploaded_cache(name)
+
+        for audio_file in already_uploaded:
+            logger.debug(f"Orphan file already uploaded, deleting: {audio_file.name}")
+            self._delete_orphan_file(audio_file)
 
         if not audio_files:
             logger.debug("No orphan audio files to upload")
@@ -591,127 +943,199 @@ class TextcastService:
         # Ensure ABS_API_KEY is set from config if available
         self._ensure_abs_api_key_env()
 
-        for audio_file in audio_files:
-            # Extract title from filename (reverse of format_filename)
-            # e.g., "tech-jobs-market-2025-part-3-job-seekers-stories.mp3" -> "tech jobs market 2025 part 3 job seekers stories"
-            title = audio_file.stem.replace("-", " ").title()
+        # Uploads are independent, so run them in parallel up to the
+        # configured number of workers
+        workers = max(1, min(self.config.processing.workers, len(audio_files)))
+        started = time.monotonic()
+        uploaded_count = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for future in as_completed(
+                executor.submit(self._upload_orphan_file, f) for f in audio_files
+            ):
+                try:
+                    uploaded_count += future.result()
+                except Exception as e:
+                    logger.error(f"Error uploading orphan file: {e}", exc_info=True)
+        logger.info(
+            f"Uploaded {uploaded_count}/{len(audio_files)} orphan file(s) "
+            f"in {time.monotonic() - started:.1f}s"
+        )
 
-            logger.info(f"Uploading orphan file: {audio_file.name}")
+    def _upload_orphan_file(self, audio_file: Path) -> bool:
+        """Upload one orphan audio file and delete it on success."""
+        # Extract title from filename (reverse of format_filename)
+        # e.g., "tech-jobs-market-2025-part-3-job-seekers-stories.mp3" -> "tech jobs market 2025 part 3 job seekers stories"
+        title = " ".join(part.capitalize() for part in audio_file.stem.split("-"))
 
-            # Build upload kwargs for both new and legacy config formats
-            upload_kwargs = {
-                "file_path": audio_file,
-                "title": title,
-            }
+        logger.debug(f"Uploading orphan file: {audio_file.name}")
 
-            if self.config.destinations:
-                upload_kwargs["destinations"] = self.config.destinations
-            else:
-                # Legacy config
-                if self.config.podservice.enabled and self.config.podservice.url:
-                    upload_kwargs["podservice_url"] = self.config.podservice.url
-                if (
-                    self.config.audiobookshelf.url
-                    and self.config.audiobookshelf.api_key
-                ):
-                    upload_kwargs["abs_url"] = self.config.audiobookshelf.url
-                    upload_kwargs["abs_library"] = (
-                        self.config.audiobookshelf.library_name
-                        or self.config.audiobookshelf.library_id
-                    )
-                    upload_kwargs["abs_folder_id"] = (
-                        self.config.audiobookshelf.folder_id
-                    )
+        # Build upload kwargs for both new and legacy config formats
+        upload_kwargs = {
+            "file_path": audio_file,
+            "title": title,
+            "session": self._upload_session,
+        }
+
+        if self.config.destinations:
+            upload_kwargs["destinations"] = self.config.destinations
+        else:
+            # Legacy config
+            if self.config.podservice.enabled and self.config.podservice.url:
+                upload_kwargs["podservice_url"] = self.config.podservice.url
+            if self.config.audiobookshelf.url and self.config.audiobookshelf.api_key:
+                upload_kwargs["abs_url"] = self.config.audiobookshelf.url
+                upload_kwargs["abs_library"] = (
+                    self.config.audiobookshelf.library_name
+                    or self.config.audiobookshelf.library_id
+                )
+                upload_kwargs["abs_folder_id"] = self.config.audiobookshelf.folder_id
 
-            success = upload_to_destinations(**upload_kwargs)
+        success = upload_to_destinations(**upload_kwargs)
 
-            if success:
-                # Delete file after successful upload
+        if success:
+            # Remember the upload so a failed delete doesn't cause a re-upload
+            self._update_uploaded_cache(audio_file.name, time.time())
+            self._delete_orphan_file(audio_file)
+        else:
+            logger.warning(f"Failed to upload orphan file: {audio_file.name}")
+        return success
+
+    def _delete_orphan_file(self, audio_file: Path):
+        """Delete an uploaded orphan file and drop it from the upload cache."""
+        try:
+            audio_file.unlink()
+            logger.debug(f"Deleted orphan file after upload: {audio_file.name}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to delete orphan file {audio_file.name}: {e}")
+            return
+        self._update_uploaded_cache(audio_file.name)
+
+    def _uploaded_cache_path(self) -> str:
+        return os.path.join(
+            self.config.processing.audio.output_dir, UPLOADED_CACHE_FILE
+        )
+
+    def _get_uploaded_cache(self) -> Dict[str, float]:
+        """Return {filename: uploaded_at} for orphans awaiting deletion."""
+        if self._uploaded is None:
+            try:
+                with open(self._uploaded_cache_path(), "r") as f:
+                    data = json.load(f)
+            except FileNotFoundError:
+                data = {}
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable upload cache: {e}")
+                data = {}
+            self._uploaded = data if isinstance(data, dict) else {}
+        return self._uploaded
+
+    def _update_uploaded_cache(self, name: str, uploaded_at: float = None):
+        """Record an uploaded orphan, or forget it when uploaded_at is None."""
+        with self._uploaded_lock:
+            cache = self._get_uploaded_cache()
+            if uploaded_at is not None:
+                cache[name] = uploaded_at
+            elif cache.pop(name, None) is None:
+                return
+
+            path = self._uploaded_cache_path()
+            tmp_path = f"{path}.tmp"
+            try:
+                with open(tmp_path, "w") as f:
+                    json.dump(cache, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Failed to save upload cache {path}: {e}")
+
+    @staticmethod
+    def _read_file_queue(source: SourceConfig) -> List[str]:
+        """Read URLs from a file source's queue; a missing file is empty."""
+        try:
+            f = open(source.file, "r")
+        except FileNotFoundError:
+            logger.debug(f"Queue file does not exist: {source.file}")
+            return []
+        with f:
+            # Handle CSV format (url,strategy)
+            return [
+                line.partition(",")[0]
+                for line in map(str.strip, f)
+                if line and line[0] != "#"
+            ]
+
+    def _process_file_queues_bulk(self, sources: List[SourceConfig]):
+        """Process several file queues with one process_texts call per strategy.
+
+        Sources sharing a processing strategy share one worker pool; each
+        queue file is still updated with only its own results.
+        """
+        self._begin_task()
+        try:
+            # URL -> every queue file it appears in, per strategy
+            groups: Dict[bool, Dict[str, List[str]]] = defaultdict(dict)
+            names: Dict[bool, List[str]] = defaultdict(list)
+            for source in sources:
                 try:
-                    audio_file.unlink()
-                    logger.info(f"Deleted orphan file after upload: {audio_file.name}")
+                    urls = self._read_file_queue(source)
+                except OSError as e:
+                    logger.error(f"Error reading queue {source.file}: {e}")
+                    continue
+                if not urls:
+                    logger.debug(f"No URLs to process in {source.file}")
+                    continue
+                condense = self._source_kwargs(source)["condense"]
+                for url in urls:
+                    files = groups[condense].setdefault(url, [])
+                    if source.file not in files:
+                        files.append(source.file)
+                names[condense].append(source.name)
+                logger.info(f"Processing {len(urls)} URLs from {source.name}")
+
+            for condense, url_files in groups.items():
+                kwargs = {**self._base_kwargs, "condense": condense}
+                try:
+                    results = _get_process_texts()(
+                        list(url_files), url_files=url_files, **kwargs
+                    )
                 except Exception as e:
-                    logger.warning(
-                        f"Failed to delete orphan file {audio_file.name}: {e}"
+                    logger.error(
+                        f"Error processing queues {names[condense]}: {e}",
+                        exc_info=True,
                     )
-            else:
-                logger.warning(f"Failed to upload orphan file: {audio_file.name}")
+                    continue
+
+                successful = sum(r.success for r in results)
+                failed = len(results) - successful
+                logger.info(
+                    f"Processing complete for {', '.join(names[condense])}: "
+                    f"{successful} successful, {failed} failed"
+                )
+        finally:
+            self._end_task()
 
     def _process_file_queue(self, source: SourceConfig):
         """Process URLs from a file queue using textcast processing."""
-        if not Path(source.file).exists():
-            logger.debug(f"Queue file does not exist: {source.file}")
-            return
-
         self._begin_task()
         try:
-            # Read URLs from queue
-            with open(source.file, "r") as f:
-                urls = []
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#"):
-                        # Handle CSV format (url,strategy)
-                        url_parts = line.split(",")
-                        urls.append(url_parts[0])
-
+            urls = self._read_file_queue(source)
             if not urls:
                 logger.debug(f"No URLs to process in {source.file}")
                 return
 
             logger.info(f"Processing {len(urls)} URLs from {source.name}")
 
-            # Prepare processing arguments from nested config
-            text_config = self.config.processing.text
-            audio_config = self.config.processing.audio
-            source_strategy = source.processing_strategy or text_config.strategy
-
-            kwargs = {
-                "file_url_list": source.file,
-                "vendor": audio_config.vendor,
-                "directory": audio_config.output_dir,
-                "audio_format": audio_config.format,
-                "speech_model": audio_config.model,
-                "text_model": text_config.model,
-                "text_provider": text_config.provider,
-                "voice": audio_config.voice,
-                "strip": None,
-                "yes": True,  # Auto-approve processing
-                "debug": False,
-                "condense": source_strategy == "condense",
-                "condense_ratio": text_config.condense_ratio,
-                "aggregator": False,
-                "auto_detect_aggregator": True,
-                "workers": self.config.processing.workers,
-            }
-
-            # Use destinations list (new format)
-            if self.config.destinations:
-                kwargs["destinations"] = self.config.destinations
-            else:
-                # Fall back to legacy config for backward compatibility
-                # Add Audiobookshelf settings
-                if (
-                    self.config.audiobookshelf.url
-                    and self.config.audiobookshelf.api_key
-                ):
-                    kwargs.update(
-                        {
-                            "abs_url": self.config.audiobookshelf.url,
-                            "abs_pod_lib_id": self.config.audiobookshelf.library_id,
-                            "abs_pod_folder_id": self.config.audiobookshelf.folder_id,
-                        }
-                    )
-
-                # Add Podservice settings
-                if self.config.podservice.enabled and self.config.podservice.url:
-                    kwargs["podservice_url"] = self.config.podservice.url
+            kwargs = self._source_kwargs(source)
+            kwargs["file_url_list"] = source.file
 
             # Process the URLs
-            results = process_texts(urls, **kwargs)
+            results = _get_process_texts()(urls, **kwargs)
 
             # Log results
-            successful = sum(1 for r in results if r.success)
+            successful = sum(r.success for r in results)
             failed = len(results) - successful
 
             logger.info(
@@ -725,14 +1149,15 @@ class TextcastService:
 
     def _process_audio_file_queue(self, source: SourceConfig):
         """Process URLs from a file queue for audio download and upload to Audiobookshelf."""
-        if not Path(source.file).exists():
-            logger.debug(f"Queue file does not exist: {source.file}")
-            return
-
         self._begin_task()
         try:
             # Read URLs from queue
-            with open(source.file, "r") as f:
+            try:
+                f = open(source.file, "r")
+            except FileNotFoundError:
+                logger.debug(f"Queue file does not exist: {source.file}")
+                return
+            with f:
                 urls = []
                 for line in f:
                     line = line.strip()
@@ -752,9 +1177,6 @@ class TextcastService:
                 logger.error("Audiobookshelf url not configured")
                 return
 
-            # Import the processing function
-            from .audiobookshelf import process_url_to_audiobookshelf
-
             # Use library_name (preferred) or fall back to library_id for backward compatibility
             library = (
                 self.config.audiobookshelf.library_name
@@ -762,19 +1184,31 @@ class TextcastService:
                 or None
             )
 
-            # Process each URL
+            abs_url = self.config.audiobookshelf.url
+            folder_id = self.config.audiobookshelf.folder_id or None
+
+            def process_one(url):
+                logger.info(f"Processing URL: {url}")
+                return process_url_to_audiobookshelf(
+                    url, abs_url, library=library, folder_id=folder_id
+                )
+
+            # Downloads are independent, so run them in parallel up to the
+            # configured number of workers
             successful_urls = []
             failed_urls = []
+            workers = max(1, min(self.config.processing.workers, len(urls)))
 
-            for url in urls:
-                logger.info(f"Processing URL: {url}")
-                try:
-                    success = process_url_to_audiobookshelf(
-                        url,
-                        self.config.audiobookshelf.url,
-                        library=library,
-                        folder_id=self.config.audiobookshelf.folder_id or None,
-                    )
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                future_to_url = {executor.submit(process_one, url): url for url in urls}
+                for future in as_completed(future_to_url):
+                    url = future_to_url[future]
+                    try:
+                        success = future.result()
+                    except Exception as e:
+                        failed_urls.append(url)
+                        logger.error(f"Error processing {url}: {e}", exc_info=True)
+                        continue
 
                     if success:
                         successful_urls.append(url)
@@ -783,22 +1217,10 @@ class TextcastService:
                         failed_urls.append(url)
                         logger.error(f"Failed to process: {url}")
 
-                except Exception as e:
-                    failed_urls.append(url)
-                    logger.error(f"Error processing {url}: {e}", exc_info=True)
-
             # Remove successfully processed URLs from the file
             if successful_urls:
                 try:
-                    with open(source.file, "r") as f:
-                        lines = f.readlines()
-
-                    with open(source.file, "w") as f:
-                        for line in lines:
-                            stripped_line = line.strip()
-                            if stripped_line not in successful_urls:
-                                f.write(line)
-
+                    remove_lines_from_file(source.file, set(successful_urls))
                     logger.info(
                         f"Removed {len(successful_urls)} successfully processed URLs from {source.file}"
                     )
@@ -819,38 +1241,58 @@ class TextcastService:
         finally:
             self._end_task()
 
-    def _upload_file_to_destinations(self, file_path: Path, source: SourceConfig):
-        """Upload audio file to configured destinations."""
+    def _upload_file_to_destinations(
+        self, file_path: Path, source: SourceConfig
+    ) -> bool:
+        """Upload audio file to configured destinations; True if uploaded."""
         if not self.config.destinations:
             logger.warning(f"No destinations configured, cannot upload {file_path}")
-            return
+            return False
+
+        # The startup scan and the watchers can both reach the same file
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            logger.debug(f"File {file_path.name} no longer exists, skipping upload")
+            return False
+        key = str(file_path.resolve())
+        if not self._claim_upload(key, mtime_ns):
+            logger.debug(f"Skipping {file_path.name} - already uploaded recently")
+            return False
 
         self._begin_task()
+        success = False
         try:
-            logger.info(f"Uploading {file_path.name} to configured destinations...")
+            logger.debug(f"Uploading {file_path.name} to configured destinations...")
 
             success = upload_to_destinations(
                 file_path=file_path,
                 title=file_path.stem,  # Use filename without extension as title
                 destinations=self.config.destinations,
+                session=self._upload_session,
             )
 
             if success:
-                logger.info(f"Successfully uploaded {file_path.name}")
+                logger.debug(f"Successfully uploaded {file_path.name}")
 
-                # Delete the file after successful upload
-                if file_path.exists():
-                    try:
-                        file_path.unlink()
-                        logger.info(f"Deleted uploaded file: {file_path.name}")
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to delete uploaded file {file_path.name}: {e}"
+                # Delete the file after successful upload, unless it was
+                # written again meanwhile and still needs that version sent
+                try:
+                    if file_path.stat().st_mtime_ns != mtime_ns:
+                        logger.info(
+                            f"{file_path.name} changed during upload, keeping it"
                         )
-                else:
+                        return success
+                    file_path.unlink()
+                    logger.debug(f"Deleted uploaded file: {file_path.name}")
+                except FileNotFoundError:
                     logger.debug(
                         f"File {file_path.name} already deleted (likely by another handler)"
                     )
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to delete uploaded file {file_path.name}: {e}"
+                    )
             else:
                 logger.error(f"Failed to upload {file_path.name}")
 
@@ -860,34 +1302,52 @@ class TextcastService:
                 exc_info=True,
             )
         finally:
+            if not success:
+                self._release_upload(key)
             self._end_task()
+        return success
 
     def _process_existing_upload_files(self, source: SourceConfig):
         """Process existing files in upload directory on service start."""
-        if not source.watch_dir or not Path(source.watch_dir).exists():
-            logger.debug(
-                f"Upload source {source.name}: directory {source.watch_dir} does not exist"
-            )
+        if not source.watch_dir:
+            logger.debug(f"Upload source {source.name}: no directory specified")
             return
 
         try:
-            watch_path = Path(source.watch_dir)
             existing_files = []
+            pattern = _compile_patterns(source.file_patterns)
 
-            # Find all matching files recursively
-            for pattern in source.file_patterns:
-                files = list(watch_path.rglob(pattern))
-                existing_files.extend(files)
+            # Find all matching files recursively, in a single scandir walk;
+            # DirEntry answers is_file/is_dir from the directory listing
+            dirs = [source.watch_dir]
+            while dirs:
+                try:
+                    entries = os.scandir(dirs.pop())
+                except (FileNotFoundError, NotADirectoryError):
+                    continue
+                with entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs.append(entry.path)
+                        elif entry.is_file() and pattern.match(entry.name):
+                            existing_files.append(Path(entry.path))
 
             if existing_files:
                 logger.info(
                     f"Found {len(existing_files)} existing files in {source.name} upload directory"
                 )
 
+                started = time.monotonic()
+                uploaded_count = 0
                 for file_path in existing_files:
-                    if file_path.is_file():  # Make sure it's actually a file
-                        logger.info(f"Processing existing file: {file_path.name}")
-                        self._upload_file_to_destinations(file_path, source)
+                    logger.debug(f"Processing existing file: {file_path.name}")
+                    uploaded_count += self._upload_file_to_destinations(
+                        file_path, source
+                    )
+                logger.info(
+                    f"Uploaded {uploaded_count}/{len(existing_files)} existing file(s) "
+                    f"from {source.name} in {time.monotonic() - started:.1f}s"
+                )
             else:
                 logger.debug(
                     f"No existing files found in {source.name} upload directory"
@@ -930,7 +1390,16 @@ def run_service(
             # Ensure log directory exists
             log_path = Path(effective_log_file)
             log_path.parent.mkdir(parents=True, exist_ok=True)
-            handlers.append(logging.FileHandler(effective_log_file))
+            # Buffer file writes; errors and a periodic flush bound the delay
+            handlers.append(
+                _TimedMemoryHandler(
+                    LOG_BUFFER_CAPACITY,
+                    LOG_FLUSH_INTERVAL,
+                    flushLevel=logging.ERROR,
+                    target=logging.FileHandler(effective_log_file),
+                    flushOnClose=True,
+                )
+            )
         except Exception as e:
             print(f"Warning: Could not setup log file {effective_log_file}: {e}")
 
@@ -946,11 +1415,19 @@ def run_service(
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
 
-    # Add new handlers with formatter
+    # Add new handlers with formatter. Records are handed to a listener
+    # thread so watcher and upload threads never block on log writes.
     formatter = logging.Formatter(log_format)
     for handler in handlers:
         handler.setFormatter(formatter)
-        root_logger.addHandler(handler)
+        if isinstance(handler, logging.handlers.MemoryHandler):
+            handler.target.setFormatter(formatter)
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    log_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    log_listener.start()
 
     logger.info(
         f"Textcast service starting in {'foreground' if foreground else 'daemon'} mode"
@@ -959,8 +1436,18 @@ def run_service(
         logger.info(f"Logging to file: {effective_log_file}")
 
     # Create and start service
-    service = TextcastService(config)
-    service.start()
+    try:
+        service = TextcastService(config)
+        service.start()
+    finally:
+        # Drain queued records and flush buffered ones before exiting
+        log_listener.stop()
+        for handler in handlers:
+            # MemoryHandler.close flushes to its target but leaves it open
+            target = getattr(handler, "target", None)
+            handler.close()
+            if target is not None:
+                target.close()
 
 
 def check_sources_once(config_path: str = None):